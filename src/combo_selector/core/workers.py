@@ -17,7 +17,9 @@ to communicate with the main thread.
 
 import logging
 import math
+import re
 import traceback
+from itertools import repeat
 
 import numpy as np
 import pandas as pd
@@ -395,14 +397,36 @@ class OMWorkerUpdateNumBin(QRunnable):
             self.signals.finished.emit()
 
 
+# Format specs that printf-style formatting renders the same way as format().
+# Flags follow format()'s order; "-" is left out: it is the default sign in
+# format() but means left-align in printf
+_PRINTF_SPEC = re.compile(r"[+ ]?#?0?\d*(\.\d+)?[eEfFgG]")
+
+
+def _printf_format(value_format):
+    """Convert a float format spec to the equivalent printf-style format.
+
+    Args:
+        value_format (str): Format spec as given to ``format()`` (e.g. ``".3f"``).
+
+    Returns:
+        str | None: printf-style format (e.g. ``"%.3f"``), or None if the
+            spec has no exact printf equivalent (e.g. ``","``, ``"%"``).
+    """
+    if _PRINTF_SPEC.fullmatch(value_format):
+        return "%" + value_format
+    return None
+
+
 class TableDataWorkerSignals(QObject):
     """Signal container for TableDataWorker.
 
     Attributes:
-        finished (Signal[object, object, object]): Emitted with (formatted_data, row_count, col_count)
-                                                   when formatting is complete.
+        finished (Signal[object, object, object]): Emitted with (formatted_columns, row_count, col_count)
+                                                   when formatting is complete; formatted_columns
+                                                   holds one list of strings per column.
     """
-    finished = Signal(object, object, object)  # formatted_data, row_count, col_count
+    finished = Signal(object, object, object)  # formatted_columns, row_count, col_count
 
 
 class TableDataWorker(QRunnable):
@@ -415,10 +439,12 @@ class TableDataWorker(QRunnable):
     Attributes:
         data (pd.DataFrame): Raw data to format.
         header_labels (list): Column header names for determining format rules.
+        cancel_event (threading.Event | None): Set by the owner to abandon
+            the run when its result is no longer wanted.
         signals (TableDataWorkerSignals): Signal object for returning results.
     """
 
-    def __init__(self, data, header_labels, value_format):
+    def __init__(self, data, header_labels, value_format, cancel_event=None):
         """Initialize the table data formatting worker.
 
         Args:
@@ -426,13 +452,24 @@ class TableDataWorker(QRunnable):
             header_labels (list): List of column header names.
             value_format (str): Format string applied to float values
                 (e.g., ``".3f"`` for three decimal places).
+            cancel_event (threading.Event | None): Optional event; once it is
+                set, the worker stops between columns and emits nothing.
         """
         super().__init__()
         self.data = data
         self.value_format = value_format
         self.header_labels = header_labels
+        self.cancel_event = cancel_event
         self.signals = TableDataWorkerSignals()
 
+    def is_cancelled(self) -> bool:
+        """Check whether the owner has abandoned this run.
+
+        Returns:
+            bool: True if the cancel event is set.
+        """
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
     @Slot()
     def run(self):
         """Execute table data formatting in background thread.
@@ -443,13 +480,25 @@ class TableDataWorker(QRunnable):
         - Other columns: String conversion
 
         Side Effects:
-            - Emits finished signal with (formatted_data, row_count, col_count)
+            - Emits finished signal with (formatted_columns, row_count, col_count),
+              unless the run was cancelled
 
         Note:
-            Uses a nested format_value function to apply column-specific formatting.
+            Columns are formatted one at a time by the nested format_column
+            function (format_value handles non-numeric columns cell by cell)
+            and handed over column-major, without a transpose to rows.
         """
-        data_cast = self.data.astype(object)
-        data_list = data_cast.values.tolist()
+        row_count, col_count = self.data.shape
+
+        # Peak capacity columns are resolved once, not by label per cell
+        int_cols = {
+            j
+            for j, label in enumerate(self.header_labels)
+            if label in ("Practical 2D peak capacity", "Predicted 2D peak capacity")
+        }
+
+        # Float columns are formatted by np.char.mod when the spec allows it
+        float_format = _printf_format(self.value_format)
 
         def format_value(val, col_idx):
             """Format a single cell value based on its column.
@@ -461,10 +510,7 @@ class TableDataWorker(QRunnable):
             Returns:
                 str: Formatted string representation of the value.
             """
-            label = (
-                self.header_labels[col_idx] if col_idx < len(self.header_labels) else ""
-            )
-            if label in ["Practical 2D peak capacity", "Predicted 2D peak capacity"]:
+            if col_idx in int_cols:
                 try:
                     return str(int(round(float(val))))
                 except Exception:
@@ -479,10 +525,57 @@ class TableDataWorker(QRunnable):
                     return str(val)
             return str(val)
 
-        formatted_data = [
-            [format_value(val, j) for j, val in enumerate(row)] for row in data_list
-        ]
+        def format_column(column, col_idx):
+            """Format a whole column, in bulk for plain NumPy dtypes.
+
+            Float and integer columns skip the per-cell type dispatch of
+            format_value: floats go through one ``np.char.mod`` call (or one
+            ``map`` for specs without a printf equivalent), NaN cells are
+            set to "NA" from one ``np.isnan`` mask, and integers through one
+            ``map``. Any other dtype falls back to format_value cell by cell.
+
+            Args:
+                column (pd.Series): The column to format.
+                col_idx (int): Column index for determining format rules.
 
-        row_count = len(data_list)
-        col_count = len(data_list[0]) if row_count > 0 else 0
-        self.signals.finished.emit(formatted_data, row_count, col_count)
\ No newline at end of file
+            Returns:
+                list: Formatted strings, one per row.
+            """
+            dtype = column.dtype
+            kind = dtype.kind if isinstance(dtype, np.dtype) else "O"
+            if kind == "f" and col_idx in int_cols:
+                return [
+                    str(int(v)) if math.isfinite(v) else str(v)
+                    for v in np.rint(column.to_numpy()).tolist()
+                ]
+
+            if kind == "f":
+                array = column.to_numpy()
+                if float_format is not None:
+                    formatted = np.char.mod(float_format, array).tolist()
+                else:
+                    formatted = list(map(format, array.tolist(), repeat(self.value_format)))
+                for i in np.flatnonzero(np.isnan(array)).tolist():
+                    formatted[i] = "NA"
+                return formatted
+
+            # Each column is pulled out once as Python scalars, instead of
+            # casting the whole frame to an object array first
+            values = column.tolist()
+
+            if kind in "iu" or (kind == "b" and col_idx not in int_cols):
+                return list(map(str, values))
+            return [format_value(val, col_idx) for val in values]
+
+        formatted_columns = []
+        for j in range(col_count):
+            if self.is_cancelled():
+                logging.debug("TableDataWorker cancelled, a newer load superseded it")
+                return
+            formatted_columns.append(format_column(self.data.iloc[:, j], j))
+
+        if row_count == 0:
+            col_count = 0
+        if self.is_cancelled():
+            return
+        self.signals.finished.emit(formatted_columns, row_count, col_count)
\ No newline at end of file
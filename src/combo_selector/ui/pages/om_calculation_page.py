@@ -1203,14 +1203,9 @@ class OMCalculationPage(QFrame):
         Returns:
             int: Row index, or -1 if not found.
         """
-        row_count = self.styled_table.get_row_count()
-
-        for row in range(row_count):
-            model_index = self.styled_table.get_proxy_model().index(row, 0)
-            if f"Set {model_index.data()}" == self.selected_set:
-                return row
-
-        return -1
+        if not self.selected_set.startswith("Set "):
+            return -1
+        return self.styled_table.find_row(self.selected_set.removeprefix("Set "))
 
     # ==========================================================================
     # Plot Wrapper Methods
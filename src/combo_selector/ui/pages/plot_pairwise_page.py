@@ -820,14 +820,9 @@ class PlotPairWisePage(QFrame):
         Returns:
             int: Row index, or -1 if not found.
         """
-        row_count = self.styled_table.get_row_count()
-
-        for row in range(row_count):
-            model_index = self.styled_table.get_proxy_model().index(row, 0)
-            if f"Set {model_index.data()}" == self.selected_set:
-                return row
-
-        return -1
+        if not self.selected_set.startswith("Set "):
+            return -1
+        return self.styled_table.find_row(self.selected_set.removeprefix("Set "))
 
     def data_set_selection_changed_from_combobox(self) -> None:
         """Handle dataset selection from combo box.
@@ -12,21 +12,540 @@ Neumorphism combines:
 Perfect for creating modern, soft UI designs with depth and tactility.
 """
 
+import logging
+import math
 import sys
 
-from PySide6.QtCore import QPoint, QRectF, QSize, Qt
+import numpy as np
+from PySide6.QtCore import QPoint, QPointF, QRect, QRectF, QSize, Qt
 from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QTransform
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
-    QGraphicsBlurEffect,
     QGraphicsEffect,
-    QGraphicsPixmapItem,
-    QGraphicsScene,
     QHBoxLayout,
     QWidget,
 )
 
+# Blur radius from which _fast_blur works on a half-resolution copy
+_DOWNSCALE_MIN_RADIUS = 6
+
+# Lines read at a time when searching the opaque bounding box of a source
+_BBOX_SCAN_BLOCK = 16
+
+# Raw OpenGL enums used by the GPU blur
+_GL_TEXTURE0 = 0x84C0
+_GL_TEXTURE_2D = 0x0DE1
+_GL_TRIANGLE_STRIP = 0x0005
+_GL_FLOAT = 0x1406
+_GL_COLOR_BUFFER_BIT = 0x4000
+_GL_TEXTURE_MAG_FILTER = 0x2800
+_GL_TEXTURE_MIN_FILTER = 0x2801
+_GL_LINEAR = 0x2601
+
+# Most linearly filtered fetch pairs per GPU pass (covers 64 texels a side)
+_GL_MAX_FETCHES = 32
+
+_BLUR_VERTEX_SHADER = """
+attribute vec2 position;
+varying vec2 uv;
+
+void main() {
+    uv = position * 0.5 + 0.5;
+    gl_Position = vec4(position, 0.0, 1.0);
+}
+"""
+
+# Separable Gaussian on every texel: each pair of adjacent taps on a side
+# is merged into one linearly filtered fetch between them, weighted by the
+# pair's sum, so a pass reads half as many texels as it has taps
+_BLUR_FRAGMENT_SHADER = """
+#ifdef GL_ES
+precision mediump float;
+#endif
+
+#define MAX_FETCHES %d
+
+uniform sampler2D source;
+uniform vec2 texel_step;
+uniform float center_weight;
+uniform int fetch_count;
+uniform vec2 fetches[MAX_FETCHES];
+varying vec2 uv;
+
+void main() {
+    vec4 color = texture2D(source, uv) * center_weight;
+    for (int i = 0; i < MAX_FETCHES; ++i) {
+        if (i >= fetch_count) {
+            break;
+        }
+        vec2 step = fetches[i].x * texel_step;
+        color += (texture2D(source, uv + step) + texture2D(source, uv - step))
+            * fetches[i].y;
+    }
+    gl_FragColor = color;
+}
+""" % _GL_MAX_FETCHES
+
+
+def _box_blur_sigma(r: int) -> float:
+    """Get the standard deviation of the CPU blur of radius r.
+
+    Three box passes of half-width b add up to a variance of b(b + 1);
+    boxes run on a half-resolution copy count twice as wide.
+
+    Args:
+        r (int): Blur radius in pixels.
+
+    Returns:
+        float: Standard deviation in pixels, 0 if r does not blur.
+    """
+    boxes = radius_to_boxes(r)
+    scale = 2 if r >= _DOWNSCALE_MIN_RADIUS else 1
+    return scale * math.sqrt(sum(b * (b + 1) / 3 for b in boxes))
+
+
+def _gl_kernel(r: int) -> tuple:
+    """Get the GPU kernel matching the CPU blur of radius r.
+
+    The Gaussian has the sigma of the three box passes, with one tap per
+    texel out to 3 sigma. Taps 1-2, 3-4, ... of each side are merged into
+    one linearly filtered fetch. Kernels too wide for ``_GL_MAX_FETCHES``
+    are split into repeated passes of a narrower Gaussian, whose variances
+    add up to the same blur.
+
+    Args:
+        r (int): Blur radius in pixels (> 0).
+
+    Returns:
+        tuple: (passes per axis, center weight,
+            list of (offset in texels, weight) fetches).
+    """
+    sigma = _box_blur_sigma(r)
+    repeats = max(1, math.ceil((3 * sigma / (2 * _GL_MAX_FETCHES)) ** 2))
+    sigma /= math.sqrt(repeats)
+
+    taps = np.arange(max(1, math.ceil(3 * sigma)) + 1)
+    weights = np.exp(-0.5 * (taps / sigma) ** 2)
+    weights /= weights[0] + 2 * weights[1:].sum()
+
+    side = weights[1:]
+    if side.size % 2:
+        side = np.append(side, 0.0)
+    pairs = side.reshape(-1, 2)
+    pair_weights = pairs.sum(axis=1)
+    # Each fetch lands between texels i and i + 1, nearer the heavier one
+    offsets = np.arange(1, side.size, 2) + pairs[:, 1] / pair_weights
+    return repeats, float(weights[0]), list(zip(offsets.tolist(), pair_weights.tolist()))
+
+
+def _box_blur_axis(channels: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Apply a 1D box blur along one axis using a cumulative sum.
+
+    Pixels outside the image are treated as fully transparent, so content
+    fades out towards the edges like Qt's own blur.
+
+    Args:
+        channels (np.ndarray): Integer pixel array of shape (h, w, 4).
+        radius (int): Box half-width in pixels (window is 2 * radius + 1).
+        axis (int): Axis to blur along (0 = vertical, 1 = horizontal).
+
+    Returns:
+        np.ndarray: Blurred array with the same shape as ``channels``.
+    """
+    window = 2 * radius + 1
+    n = channels.shape[axis]
+    channels = np.moveaxis(channels, axis, 0)
+
+    # Running sum padded with `radius + 1` zeros in front and `radius`
+    # copies of the total behind, so every window is a plain difference.
+    summed = np.empty((n + window,) + channels.shape[1:], dtype=channels.dtype)
+    summed[: radius + 1] = 0
+    np.cumsum(channels, axis=0, out=summed[radius + 1 : radius + 1 + n])
+    summed[radius + 1 + n :] = summed[radius + n]
+
+    blurred = summed[window:] - summed[:n]
+    blurred += window // 2
+    blurred //= window
+    return np.moveaxis(blurred, 0, axis)
+
+
+def _first_opaque_line(lines: np.ndarray) -> int:
+    """Get the index of the first line holding a non-transparent pixel.
+
+    Lines are tested in small blocks from the start, so a shape close to
+    the edge is found after a few lines instead of a scan of the image.
+
+    Args:
+        lines (np.ndarray): 2D array of premultiplied pixels, one line per row.
+
+    Returns:
+        int: Index of the first non-transparent line, -1 if there is none.
+    """
+    for start in range(0, lines.shape[0], _BBOX_SCAN_BLOCK):
+        hits = np.flatnonzero(lines[start : start + _BBOX_SCAN_BLOCK].any(axis=1))
+        if hits.size:
+            return start + int(hits[0])
+    return -1
+
+
+def _opaque_bbox(img: QImage) -> QRect:
+    """Get the bounding box of the non-transparent pixels of an image.
+
+    Each edge is searched inwards from the image border, so only the
+    transparent margin around the shape is read, not the whole image.
+
+    Args:
+        img (QImage): Source image.
+
+    Returns:
+        QRect: Bounding box, empty if the image is fully transparent.
+    """
+    img = img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    w, h = img.width(), img.height()
+    if w == 0 or h == 0:
+        return QRect()
+
+    stride = img.bytesPerLine() // 4
+    # Premultiplied pixels are fully transparent exactly when they are 0
+    pixels = np.frombuffer(img.constBits(), dtype=np.uint32, count=stride * h)
+    pixels = pixels.reshape(h, stride)[:, :w]
+
+    top = _first_opaque_line(pixels)
+    if top < 0:
+        return QRect()
+    bottom = h - 1 - _first_opaque_line(pixels[::-1])
+
+    band = pixels[top : bottom + 1]
+    left = _first_opaque_line(band.T)
+    right = w - 1 - _first_opaque_line(band[:, ::-1].T)
+
+    return QRect(left, top, right - left + 1, bottom - top + 1)
+
+
+def radius_to_boxes(r: int) -> tuple:
+    """Get the box radii of the three passes approximating a blur of radius r.
+
+    Radii of at least ``_DOWNSCALE_MIN_RADIUS`` are blurred on a
+    half-resolution image, so their boxes are halved accordingly.
+
+    Args:
+        r (int): Blur radius in pixels.
+
+    Returns:
+        tuple: Three box half-widths, one per pass; empty (no blur) if
+            ``r <= 0``.
+    """
+    if r <= 0:
+        return ()
+    if r >= _DOWNSCALE_MIN_RADIUS:
+        r //= 2
+    box = max(1, round(r / 3))
+    return box, box, box
+
+
+def _blur_in_place(img: QImage, boxes: tuple) -> None:
+    """Box-blur a premultiplied ARGB32 image in place.
+
+    Args:
+        img (QImage): Image in ``Format_ARGB32_Premultiplied``.
+        boxes (tuple): Box half-widths, one per pass.
+    """
+    w, h = img.width(), img.height()
+    if w == 0 or h == 0:
+        return
+
+    stride = img.bytesPerLine()
+    pixels = np.frombuffer(img.bits(), dtype=np.uint8, count=stride * h)
+    view = pixels.reshape(h, stride)[:, : w * 4].reshape(h, w, 4)
+
+    channels = view.astype(np.int32)
+    for box in boxes:
+        channels = _box_blur_axis(channels, box, axis=1)
+        channels = _box_blur_axis(channels, box, axis=0)
+    view[...] = channels
+
+
+def _fast_blur(img: QImage, r: int) -> QImage:
+    """Approximate a Gaussian blur with three successive box blurs.
+
+    Each pass costs a constant amount of work per pixel regardless of the
+    radius, and no QGraphicsScene/QGraphicsBlurEffect is involved. Large
+    radii are blurred at half resolution and scaled back, which is
+    indistinguishable for soft shadows and four times cheaper.
+
+    Args:
+        img (QImage): Source image.
+        r (int): Blur radius in pixels.
+
+    Returns:
+        QImage: Blurred image in premultiplied ARGB32 format.
+    """
+    img = img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    w, h = img.width(), img.height()
+    if r <= 0 or w == 0 or h == 0:
+        return img
+
+    boxes = radius_to_boxes(r)
+    if r >= _DOWNSCALE_MIN_RADIUS and w > 1 and h > 1:
+        small = img.scaled(
+            w // 2, h // 2, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        )
+        _blur_in_place(small, boxes)
+        return small.scaled(w, h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+    _blur_in_place(img, boxes)
+    return img
+
+
+class _GLBlur:
+    """Separable Gaussian blur rendered in an offscreen OpenGL context.
+
+    The source is uploaded as a premultiplied RGBA texture, blurred
+    horizontally into a first framebuffer and vertically into a second
+    one (ping-ponging between them when a wide kernel takes repeated
+    passes), then read back as a QImage. The texture and framebuffers
+    are kept per size and freed by release(). One instance is shared by
+    the whole process, see :func:`_shared_gl_blur`.
+
+    QtOpenGL is only imported here, so the CPU path never loads it.
+
+    Raises:
+        RuntimeError: If no OpenGL context can be created or the shaders
+            fail to compile.
+    """
+
+    def __init__(self):
+        from PySide6.QtGui import QOffscreenSurface, QOpenGLContext
+        from PySide6.QtOpenGL import (
+            QOpenGLBuffer,
+            QOpenGLShader,
+            QOpenGLShaderProgram,
+            QOpenGLVertexArrayObject,
+        )
+
+        self._context = QOpenGLContext()
+        if not self._context.create():
+            raise RuntimeError("Unable to create an OpenGL context")
+
+        self._surface = QOffscreenSurface()
+        self._surface.setFormat(self._context.format())
+        self._surface.create()
+        self._make_current()
+
+        self._program = QOpenGLShaderProgram()
+        if not (
+            self._program.addShaderFromSourceCode(
+                QOpenGLShader.Vertex, _BLUR_VERTEX_SHADER
+            )
+            and self._program.addShaderFromSourceCode(
+                QOpenGLShader.Fragment, _BLUR_FRAGMENT_SHADER
+            )
+            and self._program.link()
+        ):
+            raise RuntimeError(self._program.log())
+
+        self._vao = QOpenGLVertexArrayObject()
+        self._vao.create()
+        self._vao.bind()
+
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype=np.float32)
+        self._quad = QOpenGLBuffer(QOpenGLBuffer.VertexBuffer)
+        self._quad.create()
+        self._quad.bind()
+        self._quad.allocate(quad.tobytes(), quad.nbytes)
+
+        self._program.bind()
+        position = self._program.attributeLocation("position")
+        self._program.enableAttributeArray(position)
+        self._program.setAttributeBuffer(position, _GL_FLOAT, 0, 2)
+        self._program.release()
+
+        self._vao.release()
+        self._context.doneCurrent()
+
+        self._size = QSize()
+        self._texture = None
+        self._fbos = ()
+
+    def _make_current(self) -> None:
+        """Make the blur context current on its offscreen surface.
+
+        Raises:
+            RuntimeError: If the context cannot be made current.
+        """
+        if not self._context.makeCurrent(self._surface):
+            raise RuntimeError("Unable to make the OpenGL context current")
+
+    def _resize(self, size: QSize) -> None:
+        """Recreate the source texture and framebuffers for a new size.
+
+        Must be called with the context current.
+
+        Args:
+            size (QSize): Image size in pixels.
+        """
+        from PySide6.QtOpenGL import QOpenGLFramebufferObject, QOpenGLTexture
+
+        self._destroy_buffers()
+        self._size = QSize(size)
+
+        self._texture = QOpenGLTexture(QOpenGLTexture.Target2D)
+        self._texture.setSize(size.width(), size.height())
+        self._texture.setFormat(QOpenGLTexture.RGBA8_UNorm)
+        self._texture.allocateStorage()
+        # The kernel relies on linear filtering between merged taps
+        self._texture.setMinMagFilters(QOpenGLTexture.Linear, QOpenGLTexture.Linear)
+        self._texture.setWrapMode(QOpenGLTexture.ClampToEdge)
+
+        self._fbos = (QOpenGLFramebufferObject(size), QOpenGLFramebufferObject(size))
+        gl = self._context.functions()
+        gl.glBindTexture(_GL_TEXTURE_2D, self._fbos[0].texture())
+        gl.glTexParameteri(_GL_TEXTURE_2D, _GL_TEXTURE_MIN_FILTER, _GL_LINEAR)
+        gl.glTexParameteri(_GL_TEXTURE_2D, _GL_TEXTURE_MAG_FILTER, _GL_LINEAR)
+        gl.glBindTexture(_GL_TEXTURE_2D, 0)
+
+    def _destroy_buffers(self) -> None:
+        """Free the source texture and framebuffers (context must be current)."""
+        if self._texture is not None:
+            self._texture.destroy()
+            self._texture = None
+        self._fbos = ()
+        self._size = QSize()
+
+    def blur(self, img: QImage, r: int) -> QImage:
+        """Blur an image on the GPU.
+
+        Args:
+            img (QImage): Source image.
+            r (int): Blur radius in pixels.
+
+        Returns:
+            QImage: Blurred image in premultiplied ARGB32 format.
+
+        Raises:
+            RuntimeError: If the context cannot be made current.
+        """
+        from PySide6.QtGui import QVector2D
+        from PySide6.QtOpenGL import QOpenGLTexture
+
+        img = img.convertToFormat(QImage.Format_RGBA8888_Premultiplied)
+        w, h = img.width(), img.height()
+        if r <= 0 or w == 0 or h == 0:
+            return img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+        self._make_current()
+        gl = self._context.functions()
+
+        if self._size != img.size():
+            self._resize(img.size())
+
+        self._texture.setData(
+            QOpenGLTexture.RGBA,
+            QOpenGLTexture.UInt8,
+            bytes(img.constBits())[: img.bytesPerLine() * h],
+        )
+
+        repeats, center_weight, fetches = _gl_kernel(r)
+
+        self._vao.bind()
+        self._program.bind()
+        self._program.setUniformValue1i("source", 0)
+        self._program.setUniformValue1f("center_weight", center_weight)
+        self._program.setUniformValue1i("fetch_count", len(fetches))
+        self._program.setUniformValueArray(
+            b"fetches", [value for fetch in fetches for value in fetch], len(fetches), 2
+        )
+        gl.glViewport(0, 0, w, h)
+        gl.glActiveTexture(_GL_TEXTURE0)
+
+        # Horizontal passes first, then vertical ones, each reading the
+        # framebuffer the previous pass wrote; an even pass count always
+        # ends in the second framebuffer
+        steps = [QVector2D(1 / w, 0)] * repeats + [QVector2D(0, 1 / h)] * repeats
+        texture_id = self._texture.textureId()
+        for i, step in enumerate(steps):
+            fbo = self._fbos[i % 2]
+            fbo.bind()
+            gl.glClearColor(0, 0, 0, 0)
+            gl.glClear(_GL_COLOR_BUFFER_BIT)
+            gl.glBindTexture(_GL_TEXTURE_2D, texture_id)
+            self._program.setUniformValue("texel_step", step)
+            gl.glDrawArrays(_GL_TRIANGLE_STRIP, 0, 4)
+            fbo.release()
+            texture_id = fbo.texture()
+
+        self._program.release()
+        self._vao.release()
+
+        # Rows were uploaded top-first, so the framebuffer is already upright
+        result = self._fbos[1].toImage(False)
+        self._context.doneCurrent()
+        return result.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+    def release(self) -> None:
+        """Free every GL resource of the blur.
+
+        Safe to call more than once; the blur cannot be used afterwards.
+        """
+        if self._context is None:
+            return
+
+        if self._context.makeCurrent(self._surface):
+            self._destroy_buffers()
+            self._quad.destroy()
+            self._vao.destroy()
+            self._program.removeAllShaders()
+            self._context.doneCurrent()
+
+        self._program = None
+        self._context = None
+        self._surface.destroy()
+
+
+# Process-wide GPU blur shared by every "opengl" BoxShadow, and whether
+# creating or running it failed (then every effect stays on the CPU)
+_gl_blur = None
+_gl_blur_failed = False
+
+
+def _shared_gl_blur():
+    """Get the process-wide GPU blur, creating it on first use.
+
+    The blur releases its GL resources when the application quits.
+
+    Returns:
+        _GLBlur | None: GPU blur, None to fall back to the CPU blur.
+    """
+    global _gl_blur, _gl_blur_failed
+    if _gl_blur is not None or _gl_blur_failed:
+        return _gl_blur
+
+    try:
+        _gl_blur = _GLBlur()
+    except Exception as e:
+        logging.warning(f"OpenGL shadow blur unavailable, using CPU: {e}")
+        _gl_blur_failed = True
+        return None
+
+    app = QApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(_release_gl_blur)
+    return _gl_blur
+
+
+def _release_gl_blur(failed: bool = False) -> None:
+    """Free the process-wide GPU blur.
+
+    Args:
+        failed (bool): The blur failed; do not create it again.
+    """
+    global _gl_blur, _gl_blur_failed
+    if _gl_blur is not None:
+        _gl_blur.release()
+        _gl_blur = None
+    _gl_blur_failed = _gl_blur_failed or failed
+
 
 class BoxShadow(QGraphicsEffect):
     """Neumorphism-style box shadow effect with inner and outer shadows.
@@ -39,6 +558,8 @@ class BoxShadow(QGraphicsEffect):
         - Light outside shadows (white + gray) for raised appearance
         - Configurable border for inside shadow offset
         - Smooth rendering mode enabled by default
+        - CPU blur backend; the experimental "opengl" backend blurs smooth
+          shadows on the GPU and is only used when asked for explicitly
 
     Shadow Format:
         Each shadow is a dict with keys:
@@ -53,6 +574,12 @@ class BoxShadow(QGraphicsEffect):
         _max_y_offset (int): Maximum Y offset (for bounding rect).
         _border (int): Border width for inside shadows.
         _smooth (bool): Use smooth rendering algorithm.
+        _use_gl_blur (bool): Blur smooth shadows with the shared GPU blur.
+        _box_blur_passes (tuple): Pre-computed box radii for each shadow.
+        _outside_scratch (QImage): Reused outside shadow accumulator.
+        _inside_scratch (QImage): Reused inside shadow accumulator.
+        _mask_scratch (QImage): Reused per-layer colored source.
+        _blur_tmp (QImage): Reused half-resolution blur buffer.
 
     Example:
         >>> shadow = BoxShadow()
@@ -70,7 +597,8 @@ class BoxShadow(QGraphicsEffect):
             self,
             shadow_list: list[dict] = None,
             border: int = 3,
-            smooth: bool = True
+            smooth: bool = True,
+            backend: str = "cpu",
     ):
         """Initialize the box shadow effect.
 
@@ -79,9 +607,18 @@ class BoxShadow(QGraphicsEffect):
                 If None, uses default light outside shadows.
             border (int): Inside shadow border width in pixels. Default 3.
             smooth (bool): Use smooth rendering algorithm. Default True.
+            backend (str): Blur backend of the smooth algorithm, "cpu" or
+                the experimental "opengl". Falls back to "cpu" if OpenGL is
+                unavailable or fails. Default "cpu".
+
+        Raises:
+            ValueError: If backend is not "cpu" or "opengl".
         """
         super().__init__()
 
+        if backend not in ("cpu", "opengl"):
+            raise ValueError(f"Unknown blur backend: {backend}")
+
         # Default shadow configurations
         light_outside = [
             {"outside": True, "offset": [8, 8], "blur": 10, "color": "#ffffff"},
@@ -98,6 +635,13 @@ class BoxShadow(QGraphicsEffect):
         self._max_y_offset = 0
         self._border = 0
         self._smooth = smooth
+        self._use_gl_blur = backend == "opengl" and _shared_gl_blur() is not None
+        self._box_blur_passes = ()
+
+        self._outside_scratch = QImage()
+        self._inside_scratch = QImage()
+        self._mask_scratch = QImage()
+        self._blur_tmp = QImage()
 
         self.setShadowList(shadow_list or light_outside)
         self.setBorder(border)
@@ -111,11 +655,36 @@ class BoxShadow(QGraphicsEffect):
         Side Effects:
             - Updates shadow list
             - Recalculates max offset for bounding rect
+            - Pre-computes the box blur passes of each shadow
         """
         if shadow_list is None:
             shadow_list = []
         self._shadow_list = shadow_list
         self._set_max_offset()
+        self._box_blur_passes = tuple(
+            radius_to_boxes(shadow["blur"]) for shadow in shadow_list
+        )
+
+    def _allocate_scratch(self, size: QSize) -> None:
+        """Allocate the persistent shadow buffers if their size changed.
+
+        Buffers are sized from the cropped source the shadows are computed
+        on, so a widget whose content does not change size allocates them
+        on its first paint only.
+
+        Args:
+            size (QSize): Cropped source pixmap size in device pixels.
+        """
+        if self._outside_scratch.size() == size:
+            return
+
+        fmt = QImage.Format_ARGB32_Premultiplied
+        self._outside_scratch = QImage(size, fmt)
+        self._inside_scratch = QImage(size, fmt)
+        self._mask_scratch = QImage(size, fmt)
+        self._blur_tmp = QImage(
+            max(1, size.width() // 2), max(1, size.height() // 2), fmt
+        )
 
     def setBorder(self, border: int) -> None:
         """Set the border width for inside shadows.
@@ -149,6 +718,30 @@ class BoxShadow(QGraphicsEffect):
             self._max_y_offset,
         )
 
+    def _shadow_rect(self, source: QPixmap) -> QRect:
+        """Get the part of the source that shadows have to be computed on.
+
+        This is the bounding box of the opaque pixels, padded by the
+        furthest reach of the outside shadows.
+
+        Args:
+            source (QPixmap): Source pixmap.
+
+        Returns:
+            QRect: Rect in source pixmap coordinates, empty if the source
+                is null or fully transparent.
+        """
+        bbox = _opaque_bbox(source.toImage())
+        if bbox.isEmpty():
+            return bbox
+
+        return bbox.adjusted(
+            -self._max_x_offset,
+            -self._max_y_offset,
+            self._max_x_offset,
+            self._max_y_offset,
+        ).intersected(source.rect())
+
     def _set_max_offset(self) -> None:
         """Calculate maximum shadow offset for bounding rect.
 
@@ -167,7 +760,7 @@ class BoxShadow(QGraphicsEffect):
 
     @staticmethod
     def _blur_pixmap(src: QPixmap, blur_radius: int) -> QPixmap:
-        """Apply Gaussian blur to a pixmap.
+        """Apply an approximate Gaussian blur to a pixmap.
 
         Args:
             src (QPixmap): Source pixmap.
@@ -176,25 +769,7 @@ class BoxShadow(QGraphicsEffect):
         Returns:
             QPixmap: Blurred pixmap.
         """
-        w, h = src.width(), src.height()
-
-        effect = QGraphicsBlurEffect(blurRadius=blur_radius)
-
-        scene = QGraphicsScene()
-        item = QGraphicsPixmapItem()
-        item.setPixmap(QPixmap(src))
-        item.setGraphicsEffect(effect)
-        scene.addItem(item)
-
-        res = QImage(QSize(w, h), QImage.Format_ARGB32)
-        res.fill(Qt.transparent)
-
-        ptr = QPainter(res)
-        ptr.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        scene.render(ptr, QRectF(), QRectF(0, 0, w, h))
-        ptr.end()
-
-        return QPixmap(res)
+        return QPixmap.fromImage(_fast_blur(src.toImage(), blur_radius))
 
     @staticmethod
     def _colored_pixmap(color: QColor, pixmap: QPixmap) -> QPixmap:
@@ -238,16 +813,16 @@ class BoxShadow(QGraphicsEffect):
         painter.end()
         return pixmap
 
-    def _outside_shadow(self) -> QPixmap:
+    def _outside_shadow(self, source: QPixmap) -> QPixmap:
         """Generate outside shadows (basic algorithm).
 
+        Args:
+            source (QPixmap): Source pixmap (possibly cropped).
+
         Returns:
             QPixmap: Combined outside shadows.
         """
-        offset = QPoint()
-        mask = self.sourcePixmap(
-            Qt.DeviceCoordinates, offset
-        ).createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskInColor)
+        mask = source.createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskInColor)
 
         _pixmap_shadow_list = []
 
@@ -285,24 +860,22 @@ class BoxShadow(QGraphicsEffect):
         outside_shadow_painter.end()
 
         # Apply mask to clip shadow to outside only
-        mask = self.sourcePixmap(
-            Qt.DeviceCoordinates, offset
-        ).createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskOutColor)
+        mask = source.createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskOutColor)
 
         outside_shadow.setMask(mask)
 
         return outside_shadow
 
-    def _inside_shadow(self) -> QPixmap:
+    def _inside_shadow(self, source: QPixmap) -> QPixmap:
         """Generate inside shadows (basic algorithm).
 
+        Args:
+            source (QPixmap): Source pixmap (possibly cropped).
+
         Returns:
             QPixmap: Combined inside shadows.
         """
-        offset = QPoint()
-        mask = self.sourcePixmap(
-            Qt.DeviceCoordinates, offset
-        ).createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskInColor)
+        mask = source.createMaskFromColor(QColor(0, 0, 0, 0), Qt.MaskInColor)
 
         _pixmap_shadow_list = []
 
@@ -363,60 +936,86 @@ class BoxShadow(QGraphicsEffect):
 
         return inside_shadow
 
-    def _smooth_outside_shadow(self) -> QPixmap:
+    def _blur_layer_onto(self, painter: QPainter, index: int) -> None:
+        """Blur the current layer in _mask_scratch and paint it.
+
+        Large radii go through the half-resolution _blur_tmp buffer; the
+        painter upscales it while compositing, so nothing is allocated.
+        With the OpenGL backend the layer is blurred on the GPU instead.
+
+        Args:
+            painter (QPainter): Painter on the shadow accumulator.
+            index (int): Index of the shadow in the shadow list.
+        """
+        layer = self._mask_scratch
+        boxes = self._box_blur_passes[index]
+
+        gl_blur = _shared_gl_blur() if self._use_gl_blur else None
+        if gl_blur is not None:
+            try:
+                blurred = gl_blur.blur(layer, self._shadow_list[index]["blur"])
+            except Exception as e:
+                logging.warning(f"OpenGL shadow blur failed, using CPU: {e}")
+                _release_gl_blur(failed=True)
+                self._use_gl_blur = False
+            else:
+                painter.drawImage(0, 0, blurred)
+                return
+
+        if not boxes:
+            # Blur radius 0: hard-edged shadow, as QGraphicsBlurEffect(0)
+            painter.drawImage(0, 0, layer)
+        elif self._shadow_list[index]["blur"] >= _DOWNSCALE_MIN_RADIUS:
+            tmp = self._blur_tmp
+            tmp.fill(Qt.transparent)
+            tmp_painter = QPainter(tmp)
+            tmp_painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            tmp_painter.drawImage(tmp.rect(), layer)
+            tmp_painter.end()
+            _blur_in_place(tmp, boxes)
+            painter.drawImage(layer.rect(), tmp)
+        else:
+            _blur_in_place(layer, boxes)
+            painter.drawImage(0, 0, layer)
+
+    def _smooth_outside_shadow(self, source: QPixmap) -> QImage:
         """Generate outside shadows (smooth algorithm).
 
+        Args:
+            source (QPixmap): Source pixmap (possibly cropped).
+
         Returns:
-            QPixmap: Combined outside shadows with smooth edges.
+            QImage: Combined outside shadows with smooth edges.
         """
-        offset = QPoint()
-        source = self.sourcePixmap(Qt.DeviceCoordinates, offset)
+        self._allocate_scratch(source.size())
         w, h = source.width(), source.height()
 
-        _pixmap_shadow_list = []
+        outside_shadow = self._outside_scratch
+        outside_shadow.fill(Qt.transparent)
 
-        for _shadow in self._shadow_list:
+        outside_shadow_painter = QPainter(outside_shadow)
+        outside_shadow_painter.setRenderHints(
+            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
+        )
+
+        for i, _shadow in enumerate(self._shadow_list):
             if "outside" in _shadow:
-                shadow = QPixmap(source.size())
-                shadow.fill(Qt.transparent)
-                shadow_painter = QPainter(shadow)
+                # Source shape tinted with the shadow color, at its offset
+                self._mask_scratch.fill(Qt.transparent)
+                shadow_painter = QPainter(self._mask_scratch)
                 shadow_painter.setRenderHints(
                     QPainter.Antialiasing | QPainter.SmoothPixmapTransform
                 )
-                shadow_painter.setTransform(QTransform())
                 shadow_painter.drawPixmap(
-                    _shadow["offset"][0],
-                    _shadow["offset"][1],
-                    w,
-                    h,
-                    self._colored_pixmap(_shadow["color"], source),
+                    _shadow["offset"][0], _shadow["offset"][1], w, h, source
                 )
+                shadow_painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+                shadow_painter.fillRect(0, 0, w, h, QColor(_shadow["color"]))
                 shadow_painter.end()
 
-                _pixmap_shadow_list.append(shadow)
-
-        outside_shadow = QPixmap(source.size())
-        outside_shadow.fill(Qt.transparent)
-
-        outside_shadow_painter = QPainter(outside_shadow)
-        outside_shadow_painter.setTransform(QTransform())
-        outside_shadow_painter.setRenderHints(
-            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
-        )
-
-        for i, pixmap in enumerate(_pixmap_shadow_list):
-            outside_shadow_painter.drawPixmap(
-                0, 0, w, h, self._blur_pixmap(pixmap, self._shadow_list[i]["blur"])
-            )
-
-        outside_shadow_painter.end()
+                self._blur_layer_onto(outside_shadow_painter, i)
 
         # Cut out the source widget to leave only outside shadow
-        outside_shadow_painter = QPainter(outside_shadow)
-        outside_shadow_painter.setTransform(QTransform())
-        outside_shadow_painter.setRenderHints(
-            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
-        )
         outside_shadow_painter.setCompositionMode(
             QPainter.CompositionMode_DestinationOut
         )
@@ -426,66 +1025,50 @@ class BoxShadow(QGraphicsEffect):
 
         return outside_shadow
 
-    def _smooth_inside_shadow(self) -> QPixmap:
+    def _smooth_inside_shadow(self, source: QPixmap) -> QImage:
         """Generate inside shadows (smooth algorithm).
 
+        Args:
+            source (QPixmap): Source pixmap (possibly cropped).
+
         Returns:
-            QPixmap: Combined inside shadows with smooth edges.
+            QImage: Combined inside shadows with smooth edges.
         """
-        offset = QPoint()
-        source = self.sourcePixmap(Qt.DeviceCoordinates, offset)
+        self._allocate_scratch(source.size())
         w, h = source.width(), source.height()
 
-        _pixmap_shadow_list = []
+        inside_shadow = self._inside_scratch
+        inside_shadow.fill(Qt.transparent)
 
-        for _shadow in self._shadow_list:
+        inside_shadow_painter = QPainter(inside_shadow)
+        inside_shadow_painter.setRenderHints(
+            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
+        )
+
+        for i, _shadow in enumerate(self._shadow_list):
             if "inside" in _shadow:
-                shadow = QPixmap(source.size())
-                shadow.fill(Qt.transparent)
-                shadow_painter = QPainter(shadow)
+                # Tinted source minus itself shifted by half the offset
+                self._mask_scratch.fill(QColor(_shadow["color"]))
+                shadow_painter = QPainter(self._mask_scratch)
                 shadow_painter.setRenderHints(
                     QPainter.Antialiasing | QPainter.SmoothPixmapTransform
                 )
-                shadow_painter.setTransform(QTransform())
-                new_source = self._colored_pixmap(_shadow["color"], source)
+                shadow_painter.setCompositionMode(
+                    QPainter.CompositionMode_DestinationIn
+                )
+                shadow_painter.drawPixmap(0, 0, source)
+                shadow_painter.setCompositionMode(
+                    QPainter.CompositionMode_DestinationOut
+                )
                 shadow_painter.drawPixmap(
-                    0,
-                    0,
-                    w,
-                    h,
-                    self._cut_shadow(
-                        new_source,
-                        source,
-                        _shadow["offset"][0] / 2,
-                        _shadow["offset"][1] / 2,
-                    ),
+                    QPointF(_shadow["offset"][0] / 2, _shadow["offset"][1] / 2),
+                    source,
                 )
                 shadow_painter.end()
 
-                _pixmap_shadow_list.append(shadow)
-
-        inside_shadow = QPixmap(source.size())
-        inside_shadow.fill(Qt.transparent)
-
-        inside_shadow_painter = QPainter(inside_shadow)
-        inside_shadow_painter.setTransform(QTransform())
-        inside_shadow_painter.setRenderHints(
-            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
-        )
-
-        for i, pixmap in enumerate(_pixmap_shadow_list):
-            inside_shadow_painter.drawPixmap(
-                0, 0, w, h, self._blur_pixmap(pixmap, self._shadow_list[i]["blur"])
-            )
-
-        inside_shadow_painter.end()
+                self._blur_layer_onto(inside_shadow_painter, i)
 
         # Clip to widget bounds
-        inside_shadow_painter = QPainter(inside_shadow)
-        inside_shadow_painter.setTransform(QTransform())
-        inside_shadow_painter.setRenderHints(
-            QPainter.Antialiasing | QPainter.SmoothPixmapTransform
-        )
         inside_shadow_painter.setCompositionMode(
             QPainter.CompositionMode_DestinationIn
         )
@@ -519,25 +1102,46 @@ class BoxShadow(QGraphicsEffect):
 
         painter.setTransform(QTransform())
 
+        # Only the opaque part of the source (plus shadow reach) is processed
+        crop = self._shadow_rect(source)
+
+        # Nothing painted yet (or hidden): there is nothing to cast a shadow
+        if crop.isEmpty():
+            painter.drawPixmap(x, y, source)
+            painter.setWorldTransform(restoreTransform)
+            return
+
+        cropped = source if crop == source.rect() else source.copy(crop)
+
         # Generate shadows based on smooth mode
         if self._smooth:
-            outside_shadow = self._smooth_outside_shadow()
-            inside_shadow = self._smooth_inside_shadow()
+            outside_shadow = self._smooth_outside_shadow(cropped)
+            inside_shadow = self._smooth_inside_shadow(cropped)
         else:
-            outside_shadow = self._outside_shadow()
-            inside_shadow = self._inside_shadow()
+            outside_shadow = self._outside_shadow(cropped)
+            inside_shadow = self._inside_shadow(cropped)
 
         painter.setPen(Qt.NoPen)
 
+        # Smooth shadows are QImage scratch buffers, basic ones are QPixmaps
+        draw_layer = painter.drawImage if self._smooth else painter.drawPixmap
+
+        # Inside shadows are squeezed into the rect shrunk by the border
+        scale_x = (w - self._border * 2) / w
+        scale_y = (h - self._border * 2) / h
+
         # Draw layers: outside shadow -> source -> inside shadow
-        painter.drawPixmap(x, y, w, h, outside_shadow)
+        draw_layer(crop.translated(x, y), outside_shadow)
         painter.drawPixmap(x, y, source)
-        painter.drawPixmap(
-            x + self._border,
-            y + self._border,
-            w - self._border * 2,
-            h - self._border * 2,
+        draw_layer(
+            QRectF(
+                x + self._border + crop.x() * scale_x,
+                y + self._border + crop.y() * scale_y,
+                crop.width() * scale_x,
+                crop.height() * scale_y,
+            ),
             inside_shadow,
+            QRectF(inside_shadow.rect()),
         )
         painter.setWorldTransform(restoreTransform)
 
@@ -15,10 +15,12 @@ Features:
 - Row selection support
 """
 
+import logging
 import math
 import re
 import sys
 from enum import Enum
+from itertools import chain
 
 import numpy as np
 import pandas as pd
@@ -26,9 +28,9 @@ from PySide6.QtCore import (
     QAbstractTableModel,
     QItemSelectionModel,
     QModelIndex,
-    QRegularExpression,
     QSortFilterProxyModel,
     Qt,
+    QTimer,
 )
 from PySide6.QtGui import QBrush, QColor, QIcon, QFont
 from PySide6.QtWidgets import (
@@ -38,7 +40,9 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QSizePolicy,
+    QStyle,
     QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableView,
     QVBoxLayout,
     QWidget,
@@ -46,12 +50,238 @@ from PySide6.QtWidgets import (
 
 from combo_selector.utils import resource_path
 
+# Role and orientation ids bound once: every ``Qt.<Name>`` access goes through
+# the PySide6 enum wrapper (microseconds), and data() runs per cell per paint.
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_USER_ROLE = int(Qt.UserRole)
+_BACKGROUND_ROLE = int(Qt.BackgroundRole)
+_FOREGROUND_ROLE = int(Qt.ForegroundRole)
+_FONT_ROLE = int(Qt.FontRole)
+_TOOLTIP_ROLE = int(Qt.ToolTipRole)
+# Roles the model can answer; any other role is None without a cell lookup
+_SERVED_ROLES = frozenset(
+    (_DISPLAY_ROLE, _USER_ROLE, _BACKGROUND_ROLE, _FOREGROUND_ROLE, _FONT_ROLE, _TOOLTIP_ROLE)
+)
+_HORIZONTAL = Qt.Horizontal
+_VERTICAL = Qt.Vertical
+
+# set_data() formats numeric columns lazily, this many rows at a time
+_FORMAT_BLOCK_ROWS = 64
+
+# Search text containing any of these is matched as a regex, else as plain text
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]|()\\]")
+
+# Joins the cells of a row for substring search; never typed by the user
+_CELL_SEPARATOR = "\x1f"
+
+# Shared by every model and every "NA" cell
+_NAN_BRUSH = QBrush(QColor(0xFF, 0x99, 0x99))
+
 class COLUMN(Enum):
     """Column index enumeration for orthogonality table."""
 
     COMPLEXITY = 3
     COMPATIBILITY = 4
 
+_NUMERIC_KEY = 0
+_TEXT_KEY = 1
+
+
+def _sort_key(value) -> tuple:
+    """Normalize a cell value into a sort key.
+
+    Keys are ``(kind, key)`` tuples so any two keys compare with a single
+    tuple ``<``: numbers sort before text, NaN after every number.
+
+    Args:
+        value: Raw or formatted cell value.
+
+    Returns:
+        tuple: ``(_NUMERIC_KEY, math.inf)`` for None/NaN/"NA",
+        ``(_NUMERIC_KEY, float)`` for numeric values,
+        ``(_TEXT_KEY, str)`` otherwise.
+    """
+    if value is None:
+        return _NUMERIC_KEY, math.inf
+    try:
+        f = float(value)
+        return _NUMERIC_KEY, (f if not math.isnan(f) else math.inf)
+    except (ValueError, TypeError):
+        # Not numeric, fallback to string comparison
+        if isinstance(value, str) and value.strip().lower() == "na":
+            return _NUMERIC_KEY, math.inf
+        return _TEXT_KEY, str(value)
+
+
+def _nan_to_inf(values: np.ndarray) -> np.ndarray:
+    """Convert a numeric column to float64 sort values, NaN mapped to +inf.
+
+    Args:
+        values (np.ndarray): Integer or float column.
+
+    Returns:
+        np.ndarray: float64 array; ``values`` is not modified.
+    """
+    numeric = values.astype(np.float64, copy=False)
+    return np.where(np.isnan(numeric), np.inf, numeric)
+
+
+def _sort_keys_from_rows(
+    rows: list, is_nan: np.ndarray, row_count: int, col_count: int
+) -> list:
+    """Build the sort keys of row-major formatted data.
+
+    Args:
+        rows (list): 2D list of formatted values.
+        is_nan (np.ndarray): Boolean "NA" mask of shape (row_count, col_count).
+        row_count (int): Number of rows.
+        col_count (int): Number of columns.
+
+    Returns:
+        list[np.ndarray]: One array of sort keys per column, see
+        :func:`_sort_keys_from_columns`.
+    """
+    columns = [[row[j] for row in rows[:row_count]] for j in range(col_count)]
+    return _sort_keys_from_columns(columns, is_nan, row_count, col_count)
+
+
+def _column_sort_keys(values, missing: list, row_count: int) -> np.ndarray:
+    """Build the sort keys of one column, numbers parsed where possible.
+
+    A column whose cells are all numbers or "NA" is converted in one float
+    pass; any other column falls back to one :func:`_sort_key` call per
+    cell, tagged with its kind only if it mixes numbers and text.
+
+    Args:
+        values: Raw or formatted cell values of the column.
+        missing (list): True for each cell displayed as "NA".
+        row_count (int): Number of rows.
+
+    Returns:
+        np.ndarray: row_count sort keys, float64 (NaN mapped to +inf) for a
+        numeric column, object (strings or tuples) otherwise.
+    """
+    try:
+        numeric = np.fromiter(
+            (math.nan if na else float(v) for v, na in zip(values, missing)),
+            dtype=np.float64,
+            count=row_count,
+        )
+    except (ValueError, TypeError):
+        # Some text in the column: tag every key with its kind
+        column_keys = [_sort_key(v) for v in values]
+        if len({kind for kind, _ in column_keys}) == 1:
+            column_keys = [key for _, key in column_keys]
+        return np.fromiter(column_keys, dtype=object, count=row_count)
+    return _nan_to_inf(numeric)
+
+
+def _sort_keys_from_columns(
+    columns: list, is_nan: np.ndarray, row_count: int, col_count: int
+) -> list:
+    """Build the sort keys of column-major formatted data.
+
+    Each column keeps its own key array, so numeric columns stay float64
+    and are ordered by a C-level argsort; only text columns hold Python
+    objects, see :func:`_column_sort_keys`.
+
+    Args:
+        columns (list): One list of formatted values per column.
+        is_nan (np.ndarray): Boolean "NA" mask of shape (row_count, col_count).
+        row_count (int): Number of rows.
+        col_count (int): Number of columns.
+
+    Returns:
+        list[np.ndarray]: One array of row_count sort keys per column.
+    """
+    return [
+        _column_sort_keys(column, is_nan[:, j].tolist(), row_count)
+        for j, column in enumerate(columns[:col_count])
+    ]
+
+
+def _sorted_rows(keys: np.ndarray, descending: bool) -> np.ndarray:
+    """Stable argsort of one column of sort keys.
+
+    Tied rows keep their data order in both directions, as with the stable
+    sort of ``QSortFilterProxyModel``.
+
+    Args:
+        keys (np.ndarray): Sort keys of a single column, float64 or object.
+        descending (bool): Sort from the largest key.
+
+    Returns:
+        np.ndarray: Data row indices in sorted order.
+    """
+    if not descending:
+        return np.argsort(keys, kind="stable")
+    return (len(keys) - 1) - np.argsort(keys[::-1], kind="stable")[::-1]
+
+
+def _text_array(rows, row_count: int, col_count: int) -> np.ndarray:
+    """Pack row-major formatted values into a 2D NumPy string array.
+
+    Args:
+        rows: 2D sequence of formatted values.
+        row_count (int): Number of rows.
+        col_count (int): Number of columns.
+
+    Returns:
+        np.ndarray: Unicode array of shape (row_count, col_count).
+    """
+    return np.asarray(rows, dtype=str).reshape(row_count, col_count)
+
+
+def _text_array_from_columns(columns: list, row_count: int, col_count: int) -> np.ndarray:
+    """Pack column-major formatted values into a 2D NumPy string array.
+
+    The result is the transpose of a (col_count, row_count) array, so each
+    column stays contiguous in memory.
+
+    Args:
+        columns (list): One list of formatted values per column.
+        row_count (int): Number of rows.
+        col_count (int): Number of columns.
+
+    Returns:
+        np.ndarray: Unicode array of shape (row_count, col_count).
+    """
+    if not row_count or not col_count:
+        return np.empty((row_count, col_count), dtype=str)
+    return np.array(columns[:col_count], dtype=str).T
+
+
+def _na_mask_from_columns(columns: list, row_count: int, col_count: int) -> np.ndarray:
+    """Flag cells displayed as "NA", like :func:`_na_mask`, column by column.
+
+    Args:
+        columns (list): One list of formatted values per column.
+        row_count (int): Number of rows.
+        col_count (int): Number of columns.
+
+    Returns:
+        np.ndarray: Boolean array of shape (row_count, col_count).
+    """
+    mask = np.zeros((row_count, col_count), dtype=bool)
+    for j, column in enumerate(columns[:col_count]):
+        mask[:, j] = np.fromiter(
+            (v.strip().lower() == "na" for v in column), dtype=bool, count=row_count
+        )
+    return mask
+
+
+def _na_mask(formatted: np.ndarray) -> np.ndarray:
+    """Flag cells displayed as "NA" (case and surrounding blanks ignored).
+
+    Args:
+        formatted (np.ndarray): 2D unicode array of formatted values.
+
+    Returns:
+        np.ndarray: Boolean array of the same shape.
+    """
+    return np.char.lower(np.char.strip(formatted)) == "na"
+
+
 class OrthogonalityTableSortProxy(QSortFilterProxyModel):
     """Sort proxy that handles NaN values intelligently.
 
@@ -63,6 +293,17 @@ class OrthogonalityTableSortProxy(QSortFilterProxyModel):
     - Numeric sorting when possible
     - String fallback for non-numeric data
     - Sequential vertical header numbering
+
+    Sorting is delegated to the source model, see :meth:`sort`. This is a
+    deliberate departure from a sorting proxy: the proxy keeps no
+    permutation of its own, the source model reorders its rows instead.
+    Consequences:
+
+    - A source row is a position in the sorted order, not a DataFrame row;
+      read cells through the model (``index.data()``), never by position
+      in the original frame.
+    - Every view or proxy on the same source model sees the same order;
+      each table widget owns its model, so none share one today.
     """
 
     def __init__(self):
@@ -70,38 +311,23 @@ class OrthogonalityTableSortProxy(QSortFilterProxyModel):
         super().__init__()
         self._column_regexes = {}
         self._filters_spec_list = []
+        self._active_filters = []
+        self._needle = ""
+        self._search_regex = None
 
-    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
-        """Compare two values for sorting.
-
-        Args:
-            left (QModelIndex): Left value index.
-            right (QModelIndex): Right value index.
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Sort by reordering the source model.
 
-        Returns:
-            bool: True if left < right.
+        The source model orders its rows with one NumPy argsort of the column
+        sort keys (see :meth:`OrthogonalityTableModel.sort`); the proxy itself
+        stays unsorted and only filters, so no Python ``lessThan`` runs per
+        comparison.
 
-        Sorting rules:
-            - NaN → +infinity (always last)
-            - None → +infinity (always last)
-            - Numeric values compared numerically
-            - Non-numeric compared as strings
+        Args:
+            column (int): Column to sort by, ``-1`` for data order.
+            order (Qt.SortOrder): Sort direction.
         """
-        left_data = self.sourceModel().data(left, Qt.DisplayRole)
-        right_data = self.sourceModel().data(right, Qt.DisplayRole)
-
-        def norm(v):
-            """Normalize value for comparison."""
-            if v is None:
-                return math.inf
-            try:
-                f = float(v)
-                return f if not math.isnan(f) else math.inf
-            except (ValueError, TypeError):
-                # Not numeric, fallback to string comparison
-                return v
-
-        return norm(left_data) < norm(right_data)
+        self.sourceModel().sort(column, order)
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         """Get header data with sequential vertical numbering.
@@ -114,7 +340,7 @@ class OrthogonalityTableSortProxy(QSortFilterProxyModel):
         Returns:
             Header data or None.
         """
-        if orientation == Qt.Vertical and role == Qt.DisplayRole:
+        if orientation == _VERTICAL and role == _DISPLAY_ROLE:
             return str(section + 1)  # Sequential row numbers
         return super().headerData(section, orientation, role)
 
@@ -132,62 +358,93 @@ class OrthogonalityTableSortProxy(QSortFilterProxyModel):
     def set_multi_column_filters(self, filters_spec_list: dict) -> None:
         # filters = {col: (filter_name, pattern)}
         self._filters_spec_list = filters_spec_list
+        # Compile once here instead of once per row; columns without a
+        # pattern are dropped so an idle filter costs nothing per row.
+        self._active_filters = [
+            (spec["filter_column"], re.compile(spec["patterns"]))
+            for spec in filters_spec_list
+            if spec["patterns"]
+        ]
         self.invalidateFilter()
 
     def setColumnRegex(self, column: int, pattern: str, case_sensitive: bool = True):
-        """Compile and store a regex pattern for a specific column."""
-        if not pattern:
-            # If the pattern is empty, remove the filter for this column
+        """Compile and store a regex pattern for a specific column.
+
+        Rows are kept only if the column's display text matches, on top of
+        the multi-column filters and the search text.
+
+        Args:
+            column (int): Column index.
+            pattern (str): Regex pattern, empty to remove the column's filter.
+            case_sensitive (bool): Match case. Default True.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        regex = re.compile(pattern, flags) if pattern else None
+
+        # Same pattern again (e.g. a repeated keystroke signal): the rows
+        # already reflect it, so skip the full re-filter
+        if self._column_regexes.get(column) == regex:
+            return
+
+        if regex is None:
             self._column_regexes.pop(column, None)
         else:
-            # Choose case sensitivity flag
-            flags = 0 if case_sensitive else re.IGNORECASE
-
-            # Compile the regex pattern using Python's re module
-            self._column_regexes[column] = pattern
+            self._column_regexes[column] = regex
 
         # Tell the widget to redraw and re-filter the data
         self.invalidateFilter()
 
+    def set_search_text(self, text: str) -> None:
+        """Filter rows on a search text matched against every column.
+
+        Plain text is matched as a case-insensitive substring of the cells.
+        Text containing regex metacharacters is matched as a case-insensitive
+        regex instead; an incomplete regex falls back to plain text.
+
+        Args:
+            text (str): Search text, empty to show all rows.
+
+        Side Effects:
+            - Re-filters the proxy.
+        """
+        self._needle = text.casefold()
+        self._search_regex = None
+        if _REGEX_METACHARS.search(text):
+            try:
+                self._search_regex = re.compile(text, re.IGNORECASE)
+            except re.error:
+                logging.debug(f"Search text {text!r} is not a valid regex, matching it as plain text")
+        self.invalidateFilter()
+
+    def _search_accepts_row(self, model, source_row: int, source_parent: QModelIndex) -> bool:
+        """Return True if any cell of ``source_row`` matches the search text."""
+        rows = model.search_rows()
+        if source_row >= len(rows):
+            return False  # placeholder row
+        if self._search_regex is None:
+            return self._needle in rows[source_row]
+
+        search = self._search_regex.search
+        return any(search(cell) for cell in rows[source_row].split(_CELL_SEPARATOR))
+
     def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
+        if not self._active_filters and not self._column_regexes and not self._needle:
+            return True  # no active pattern → identity, every row is visible
 
-        for filter_spec in self._filters_spec_list:
-            col = filter_spec["filter_column"]
-            patterns = filter_spec["patterns"]
+        model = self.sourceModel()
 
-            if not patterns:  # no active pattern for this column, skip
-                continue
+        if self._needle and not self._search_accepts_row(model, source_row, source_parent):
+            return False
 
+        for col, python_re in chain(self._active_filters, self._column_regexes.items()):
             index = model.index(source_row, col, source_parent)
-            cell_value = str(model.data(index) or "")
-
-            python_re = re.compile(patterns)
+            cell_value = str(model.data(index, _DISPLAY_ROLE) or "")
 
             if not python_re.search(cell_value):
                 return False  # this filter fails → row is rejected
 
         return True  # all filters passed → row is visible
 
-    # def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-    #     # If no active regex filters exist, show the row
-    #     if not self._column_regexes:
-    #         return True
-    #
-    #     # Check every active column filter (AND logic)
-    #     for column, compiled_regex in self._column_regexes.items():
-    #         index = self.sourceModel().index(source_row, column, source_parent)
-    #         cell_data = str(self.sourceModel().data(index, self.filterRole()))
-    #
-    #         # 2. Compile it using Python's engine
-    #         python_re = re.compile(compiled_regex)
-    #
-    #         # 3. Use search
-    #         if python_re.search(cell_data):
-    #             return True
-    #
-    #     return False  # Keep the row if it passes ALL filters
-
 class OrthogonalityTableModel(QAbstractTableModel):
     """Table model for orthogonality analysis results.
 
@@ -197,8 +454,22 @@ class OrthogonalityTableModel(QAbstractTableModel):
     - NaN values highlighted with red background
 
     Attributes:
-        _raw_data (list): Original unformatted data.
-        _formatted_data (list): Cached formatted strings for display.
+        _columns (list): Raw column arrays in column order, as given to
+            :meth:`set_data` (empty for preformatted data).
+        _formatted_data (np.ndarray): Cached formatted strings for display,
+            shape (rows, cols).
+        _is_nan (np.ndarray): Boolean mask of "NA" cells, highlighted through
+            ``Qt.BackgroundRole``.
+        _pending_blocks (np.ndarray | None): Blocks of ``_FORMAT_BLOCK_ROWS``
+            rows whose numeric cells are not formatted yet, None when done.
+        _sort_keys (list): One array of sort keys per column, served via
+            ``Qt.UserRole``: float64 (NaN mapped to +inf) for numeric
+            columns; strings, or ``(kind, key)`` tuples in columns mixing
+            numbers and text (text after numbers), for the others.
+        _row_order (list): Data row shown at each model row, set by
+            :meth:`sort`; the arrays above stay in data order.
+        _search_rows (list | None): Casefolded text of each model row for the
+            proxy's substring search, built from ``_search_source``.
         header_label (list): Column header labels.
         _row_count (int): Number of rows.
         _column_count (int): Number of columns.
@@ -221,33 +492,93 @@ class OrthogonalityTableModel(QAbstractTableModel):
         self.has_tooltip = has_tooltip
         self._color_config = color_config or {}       # { col: { val: hex } }
         self._bold_columns = bold_columns or []       # [col_index, ...]
-        self._raw_data = None
-        self._formatted_data = []
+        self._columns = []
+        self._formatted_data = np.empty((0, 0), dtype=str)
+        self._is_nan = np.zeros((0, 0), dtype=bool)
+        self._pending_blocks = None  # Blocks of rows not formatted yet (set_data)
+        self._lazy_columns = []
+        self._search_source = None
+        self._search_text = []
+        self._search_rows = None
+        self._row_order = []  # data row shown at each model row
+        self._sort_state = None  # (column, order) of _row_order, None if unsorted
+
+        # Decoration objects are built once; data() hands out the same instances
+        self._foreground_colors = {
+            col: {val: QColor(hex_color) for val, hex_color in colors.items()}
+            for col, colors in self._color_config.items()
+        }
+        self._configured_foreground = QColor("#333333")
+        self._default_foreground = QColor("#222222")
+        self._font = QFont("Segoe UI", 9)
+        self._bold_font = QFont(self._font)
+        self._bold_font.setBold(True)
+        self._sort_keys = []
         self.default_row_count = 0
         self._data = data if data is not None else pd.DataFrame()
         self.header_label = []
+        self._int_cols = set()
         self.proxy_model = None
         self._row_count = 0
         self._column_count = 0
 
     def set_default_row_count(self, row_count: int) -> None:
-        """Set default row count and emit model reset.
+        """Set default row count.
+
+        Growing appends placeholder rows; shrinking an empty model removes
+        rows. Only shrinking below loaded data needs a full model reset.
 
         Args:
             row_count (int): Number of rows.
         """
-        self._row_count = row_count
-        self.modelReset.emit()
+        old_count = self._row_count
+        if row_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, row_count - 1)
+            self._row_count = row_count
+            self.endInsertRows()
+        elif row_count < old_count:
+            if self._formatted_data.size:
+                self.beginResetModel()
+                self._row_count = row_count
+                self.endResetModel()
+            else:
+                self.beginRemoveRows(QModelIndex(), row_count, old_count - 1)
+                self._row_count = row_count
+                self.endRemoveRows()
 
     def set_header_label(self, header_label: list) -> None:
-        """Set column headers and emit model reset.
+        """Set column headers.
+
+        Emits ``headerDataChanged`` when the column count is unchanged, so
+        views and proxies keep their rows, sort and filter; otherwise the
+        added or removed columns are announced.
 
         Args:
             header_label (list): List of column header strings.
         """
+        # Rows already formatted used the previous labels, finish them alike
+        self._format_pending_blocks()
+
+        old_count = self._column_count
+        new_count = len(header_label)
+
+        if new_count > old_count:
+            self.beginInsertColumns(QModelIndex(), old_count, new_count - 1)
+        elif new_count < old_count:
+            self.beginRemoveColumns(QModelIndex(), new_count, old_count - 1)
+
         self.header_label = header_label
-        self._column_count = len(self.header_label)
-        self.modelReset.emit()
+        self._int_cols = {
+            i for i, label in enumerate(header_label) if label == "Practical 2D peak capacity"
+        }
+        self._column_count = new_count
+
+        if new_count > old_count:
+            self.endInsertColumns()
+        elif new_count < old_count:
+            self.endRemoveColumns()
+        elif new_count:
+            self.headerDataChanged.emit(_HORIZONTAL, 0, new_count - 1)
 
     def get_header_label(self) -> list:
         """Get column headers.
@@ -271,8 +602,18 @@ class OrthogonalityTableModel(QAbstractTableModel):
         Args:
             data (list): 2D list of formatted strings.
         """
-        self._formatted_data = data
-        self.modelReset.emit()
+        self.beginResetModel()
+        self._columns = []
+        self._formatted_data = _text_array(data, len(data), self._column_count)
+        self._is_nan = _na_mask(self._formatted_data)
+        self._pending_blocks = None
+        self._sort_keys = _sort_keys_from_rows(
+            data, self._is_nan, len(data), self._column_count
+        )
+        self._row_order = list(range(len(data)))
+        self._sort_state = None
+        self._row_count = len(data)
+        self.endResetModel()
 
     def set_data(self, data: pd.DataFrame) -> None:
         """Set data from pandas DataFrame with automatic formatting.
@@ -281,25 +622,202 @@ class OrthogonalityTableModel(QAbstractTableModel):
             data (pd.DataFrame): Data to display.
 
         Side Effects:
-            - Formats all values for display
+            - Formats text columns now and numeric columns lazily, block
+              by block, on display
             - Emits model reset signal
         """
         self.beginResetModel()
-        data_cast = data.astype(object)
-        data_list = data_cast.values.tolist()
-
-        self._raw_data = data_list
 
-        # Cache formatted values for display
-        self._formatted_data = [
-            [self._format_value(val, col_idx=j) for j, val in enumerate(row)]
-            for row in data_list
+        # Columnar store: one native NumPy array per column, no object boxing.
+        # Taken by position, so duplicate column names each keep their values
+        self._columns = [data.iloc[:, j].to_numpy() for j in range(data.shape[1])]
+        row_count, col_count = len(data.index), len(self._columns)
+
+        # Text columns are needed now (sort keys); numeric ones only once
+        # their rows are displayed, see _format_block(). The NaN mask comes
+        # straight from the raw values and is complete right away.
+        self._formatted_data = np.empty((row_count, col_count), dtype=object)
+        self._is_nan = np.zeros((row_count, col_count), dtype=bool)
+        self._lazy_columns = []
+        for j, values in enumerate(self._columns):
+            if values.dtype.kind in "iuf":
+                self._lazy_columns.append(j)
+                # Floats display "NA" for NaN, except integer-rounded columns
+                if values.dtype.kind == "f" and j not in self._int_cols:
+                    self._is_nan[:, j] = np.isnan(values)
+            else:
+                formatted = self._format_column(values, j)
+                self._formatted_data[:, j] = formatted
+                self._is_nan[:, j] = _na_mask(formatted)
+        block_count = -(-row_count // _FORMAT_BLOCK_ROWS)
+        self._pending_blocks = np.ones(block_count, dtype=bool) if block_count else None
+
+        # Sort keys: bare floats (NaN → +inf) for numeric columns; other
+        # columns are parsed from their raw values, so an object column of
+        # numbers still sorts numerically, with text keys only as fallback
+        self._sort_keys = [
+            _nan_to_inf(values)
+            if values.dtype.kind in "iuf"
+            else _column_sort_keys(values, self._is_nan[:, j].tolist(), row_count)
+            for j, values in enumerate(self._columns)
         ]
+        self._row_order = list(range(row_count))
+        self._sort_state = None
 
-        self._row_count = len(data_list)
-        self._column_count = len(data_list[0]) if self._row_count > 0 else 0
+        self._row_count = row_count
+        self._column_count = col_count if row_count > 0 else 0
         self.endResetModel()
 
+    def _format_block(self, block: int) -> None:
+        """Format the numeric columns of one block of rows.
+
+        Args:
+            block (int): Block index, rows ``block * _FORMAT_BLOCK_ROWS`` on.
+
+        Side Effects:
+            - Fills ``_formatted_data`` for those rows.
+        """
+        start = block * _FORMAT_BLOCK_ROWS
+        stop = start + _FORMAT_BLOCK_ROWS
+        for j in self._lazy_columns:
+            self._formatted_data[start:stop, j] = self._format_column(
+                self._columns[j][start:stop], j
+            )
+
+        # The table stays an object array once complete: converting it to
+        # a string array would copy every cell from inside data()
+        self._pending_blocks[block] = False
+        if not self._pending_blocks.any():
+            self._pending_blocks = None
+
+    def _format_pending_blocks(self) -> None:
+        """Format every block not displayed yet.
+
+        Side Effects:
+            - Completes ``_formatted_data`` and ``_is_nan``.
+        """
+        while self._pending_blocks is not None:
+            self._format_block(int(np.argmax(self._pending_blocks)))
+
+    def search_rows(self) -> list:
+        """Return the casefolded text of each row, for substring search.
+
+        The cells of a row are joined with a separator that cannot be typed,
+        so a substring of the result is a substring of a single cell. The
+        text is rebuilt only when the formatted data has been replaced, and
+        reordered when the rows have been sorted.
+
+        Returns:
+            list[str]: One string per data row, in model row order.
+
+        Side Effects:
+            - Formats any pending row blocks.
+        """
+        self._format_pending_blocks()
+        if self._search_source is not self._formatted_data:
+            self._search_source = self._formatted_data
+            self._search_text = [
+                _CELL_SEPARATOR.join(row).casefold()
+                for row in self._formatted_data.tolist()
+            ]
+            self._search_rows = None
+        if self._search_rows is None:
+            self._search_rows = [self._search_text[i] for i in self._row_order]
+        return self._search_rows
+
+    def display_column(self, column: int) -> np.ndarray:
+        """Return the display text of a whole column in one call.
+
+        Args:
+            column (int): Column index.
+
+        Returns:
+            np.ndarray: Formatted values of the data rows, in model row order
+            (placeholder rows excluded).
+
+        Side Effects:
+            - Formats any pending row blocks if ``column`` is formatted lazily.
+        """
+        if not 0 <= column < self._formatted_data.shape[1]:
+            return np.empty(0, dtype=str)  # no data loaded for this column
+        if column in self._lazy_columns:
+            self._format_pending_blocks()
+        return self._formatted_data[self._row_order, column]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Reorder the data rows by a column.
+
+        The whole column is ordered with one stable NumPy argsort of its sort
+        keys; the data arrays are left untouched and only the row order
+        changes. Persistent indexes (selection, current cell) follow their
+        rows.
+
+        Args:
+            column (int): Column to sort by; out of range (e.g. ``-1``)
+                restores data order.
+            order (Qt.SortOrder): Sort direction.
+
+        Side Effects:
+            - Emits ``layoutAboutToBeChanged``/``layoutChanged`` unless the
+              rows are already in that order.
+        """
+        if (column, order) == self._sort_state:
+            return
+
+        data_rows, data_cols = self._formatted_data.shape
+        if 0 <= column < data_cols:
+            descending = order == Qt.DescendingOrder
+            new_order = _sorted_rows(self._sort_keys[column], descending)
+        else:
+            new_order = np.arange(data_rows)
+        new_row = np.empty(data_rows, dtype=np.intp)
+        new_row[new_order] = np.arange(data_rows)
+
+        self.layoutAboutToBeChanged.emit()
+        old_order = self._row_order
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(int(new_row[old_order[index.row()]]), index.column())
+            if index.row() < data_rows
+            else index  # placeholder rows are not sorted
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self._row_order = new_order.tolist()
+        self._search_rows = None
+        self._sort_state = (column, order)
+        self.layoutChanged.emit()
+
+    def _format_column(self, values: np.ndarray, col_idx: int) -> np.ndarray:
+        """Format a whole column for display.
+
+        Applies the same rules as :meth:`_format_value`, but with one NumPy
+        call per column for numeric dtypes instead of one Python call per cell.
+
+        Args:
+            values (np.ndarray): Column values.
+            col_idx (int): Column index for special formatting.
+
+        Returns:
+            np.ndarray: Formatted strings, one per row.
+        """
+        kind = values.dtype.kind
+
+        if kind in "iuf" and col_idx in self._int_cols:
+            values = values.astype(np.float64, copy=False)
+            nan_mask = np.isnan(values)
+            rounded = np.rint(np.where(nan_mask, 0.0, values)).astype(np.int64).astype(str)
+            return np.where(nan_mask, "nan", rounded)
+
+        if kind == "f":
+            return np.where(np.isnan(values), "NA", np.char.mod("%.3f", values))
+
+        if kind != "O":
+            return values.astype(str)
+
+        # Object/mixed columns: per-cell fallback
+        return np.array([self._format_value(val, col_idx=col_idx) for val in values], dtype=str)
+
     def _format_value(self, val, col_idx: int = None) -> str:
         """Format a value for display.
 
@@ -313,16 +831,12 @@ class OrthogonalityTableModel(QAbstractTableModel):
         Formatting rules:
             - "Practical 2D peak capacity": Rounded to integer
             - Integers: As-is
+            - NaN: "NA"
             - Floats: 3 decimal places
             - Others: String representation
         """
         # Special case: "Practical 2D peak capacity" column
-        if (
-                col_idx is not None
-                and self.header_label
-                and col_idx < len(self.header_label)
-                and self.header_label[col_idx] == "Practical 2D peak capacity"
-        ):
+        if col_idx in self._int_cols:
             try:
                 return str(int(round(float(val))))
             except Exception:
@@ -331,7 +845,7 @@ class OrthogonalityTableModel(QAbstractTableModel):
         # Type-based formatting
         if isinstance(val, (int, np.integer)):
             return str(val)
-        elif val == np.nan:
+        elif isinstance(val, (float, np.floating)) and math.isnan(val):
             return "NA"
         elif isinstance(val, (float, np.floating)):
             return f"{val:.3f}"
@@ -349,7 +863,39 @@ class OrthogonalityTableModel(QAbstractTableModel):
             col_count (int): Number of columns.
         """
         self.beginResetModel()
-        self._formatted_data = formatted_data
+        self._columns = []
+        self._formatted_data = _text_array(formatted_data, row_count, col_count)
+        self._is_nan = _na_mask(self._formatted_data)
+        self._pending_blocks = None
+        self._sort_keys = _sort_keys_from_rows(
+            formatted_data, self._is_nan, row_count, col_count
+        )
+        self._row_order = list(range(row_count))
+        self._sort_state = None
+        self._row_count = row_count
+        self._column_count = col_count
+        self.endResetModel()
+
+    def apply_formatted_columns(self, columns: list, row_count: int, col_count: int) -> None:
+        """Apply preformatted data given column by column.
+
+        Same as :meth:`apply_formatted_data` for column-major input, as
+        produced by ``TableDataWorker``: the cells, NA mask and sort keys are
+        built one column at a time, without transposing to rows first.
+
+        Args:
+            columns (list): One list of formatted values per column.
+            row_count (int): Number of rows.
+            col_count (int): Number of columns.
+        """
+        self.beginResetModel()
+        self._columns = []
+        self._formatted_data = _text_array_from_columns(columns, row_count, col_count)
+        self._is_nan = _na_mask_from_columns(columns, row_count, col_count)
+        self._pending_blocks = None
+        self._sort_keys = _sort_keys_from_columns(columns, self._is_nan, row_count, col_count)
+        self._row_order = list(range(row_count))
+        self._sort_state = None
         self._row_count = row_count
         self._column_count = col_count
         self.endResetModel()
@@ -367,54 +913,76 @@ class OrthogonalityTableModel(QAbstractTableModel):
         Returns:
             Data appropriate for the role, or None.
         """
-        if not index.isValid() or not self._formatted_data:
+        if role not in _SERVED_ROLES or not index.isValid():
             return None
 
         r, c = index.row(), index.column()
+        rows, cols = self._formatted_data.shape
+        if r >= rows or c >= cols:
+            # Placeholder cell: default rows, or header wider than the data
+            return None
+
+        return self._cell_data(self._row_order[r], c, role)
+
+    def _cell_data(self, r: int, c: int, role: int):
+        """Resolve one role of a valid cell.
+
+        Args:
+            r (int): Data row index (model row mapped through ``_row_order``).
+            c (int): Column index.
+            role (int): Data role.
+
+        Returns:
+            Data appropriate for the role, or None.
+        """
+        # Sort role first: it is queried O(N log N) times by the proxy
+        if role == _USER_ROLE:
+            return self._sort_keys[c][r]
 
-        if role == Qt.DisplayRole:
-            return self._formatted_data[r][c]
+        # Mask lookup, does not need the cell text
+        if role == _BACKGROUND_ROLE:
+            return _NAN_BRUSH if self._is_nan[r, c] else None
 
-        if role == Qt.UserRole:
-            return self._formatted_data[r][c]
+        pending = self._pending_blocks
+        if pending is not None and pending[r // _FORMAT_BLOCK_ROWS]:
+            self._format_block(r // _FORMAT_BLOCK_ROWS)
 
-        if role == Qt.ForegroundRole and self._enable_decoration:
-            val = self._formatted_data[r][c]
-            if c in self._color_config:
-                hex_color = self._color_config[c].get(val, "#333333")
-                return QColor(hex_color)
-            return QColor("#222222")
+        if role == _DISPLAY_ROLE:
+            return self._formatted_data[r, c]
 
-        if role == Qt.FontRole and self._enable_decoration:
-            font = QFont("Segoe UI", 9)
-            if c in self._bold_columns:
-                font.setBold(True)
-            return font
+        if role == _FOREGROUND_ROLE and self._enable_decoration:
+            colors = self._foreground_colors.get(c)
+            if colors is not None:
+                return colors.get(self._formatted_data[r, c], self._configured_foreground)
+            return self._default_foreground
 
-        if role == Qt.ToolTipRole and self.has_tooltip:
+        if role == _FONT_ROLE and self._enable_decoration:
+            return self._bold_font if c in self._bold_columns else self._font
+
+        if role == _TOOLTIP_ROLE and self.has_tooltip:
             if c in self.tooltip_config:
                 tooltip = self.tooltip_config[c][r]
                 return tooltip
-        if role == Qt.BackgroundRole:
-            val = str(self._formatted_data[r][c]).strip().lower()
-            if val == 'na':
-                return QBrush(QColor("#ff9999"))
-            return None
+        return None
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Get number of rows.
 
         Returns:
-            int: Row count.
+            int: Row count, 0 for any valid parent (the model is flat).
         """
+        if parent.isValid():
+            return 0
         return self._row_count
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Get number of columns.
 
         Returns:
-            int: Column count.
+            int: Column count, 0 for any valid parent (the model is flat).
         """
+        if parent.isValid():
+            return 0
         return self._column_count
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
@@ -428,9 +996,9 @@ class OrthogonalityTableModel(QAbstractTableModel):
         Returns:
             Header label or None.
         """
-        if role != Qt.DisplayRole:
+        if role != _DISPLAY_ROLE:
             return None
-        if orientation == Qt.Horizontal and section < len(self.header_label):
+        if orientation == _HORIZONTAL and section < len(self.header_label):
             return self.header_label[section]
         return None
 
@@ -450,17 +1018,23 @@ class SquareBackgroundDelegate(QStyledItemDelegate):
             option (QStyleOptionViewItem): Style options.
             index (QModelIndex): Cell index.
         """
-        # Paint square background if model provides one
-        brush = index.data(Qt.BackgroundRole)
-        if isinstance(brush, QColor):
-            brush = QBrush(brush)
-        if isinstance(brush, QBrush):
-            painter.save()
-            painter.fillRect(option.rect, brush)  # Square, no rounded corners
-            painter.restore()
+        # Common case: no background, let Qt draw the cell as usual
+        brush = index.data(_BACKGROUND_ROLE)
+        if brush is None:
+            super().paint(painter, option, index)
+            return
+
+        # Paint square background (fillRect leaves the painter state untouched
+        # and takes a QBrush or a QColor as is)
+        painter.fillRect(option.rect, brush)  # Square, no rounded corners
 
-        # Let Qt draw text, focus, etc.
-        super().paint(painter, option, index)
+        # Same as QStyledItemDelegate.paint, minus the background re-fill
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.backgroundBrush = QBrush()
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
 
 
 class OrthogonalityTableView(QTableView):
@@ -504,6 +1078,14 @@ class OrthogonalityTableView(QTableView):
         self._actionLayout = None
         self._toolButtonMap = {}
 
+        # Search input is debounced: one filter pass per typing burst
+        self._pending_filter_text = ""
+        self._applied_filter_text = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         if model:
             self.setModel(model)
 
@@ -528,6 +1110,8 @@ class OrthogonalityTableView(QTableView):
         v_header = self.verticalHeader()
         v_header.setDefaultSectionSize(22)
         v_header.setMinimumSectionSize(18)
+        # Uniform rows: no per-row size bookkeeping when rows are added
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
         v_header.hide()
 
         # Smooth scrolling
@@ -547,13 +1131,14 @@ class OrthogonalityTableView(QTableView):
             - Creates and stores a new ``_proxyModel``.
             - Calls :meth:`QTableView.setModel` with the proxy.
             - Applies initial sort (ascending, column 0).
+            - Re-sorts by column 0 once after each reset of ``model``.
         """
+        # Configure the proxy before attaching the model; setSourceModel
+        # resets the proxy itself, so no extra invalidate() is needed
         self._proxyModel = OrthogonalityTableSortProxy()
-        self._proxyModel.setSortRole(Qt.UserRole)
         self._proxyModel.setDynamicSortFilter(True)
-        self._proxyModel.setSourceModel(model)
-        self._proxyModel.invalidate()
         self._proxyModel.setFilterKeyColumn(-1)
+        self._proxyModel.setSourceModel(model)
 
         super().setModel(self._proxyModel)
 
@@ -561,9 +1146,16 @@ class OrthogonalityTableView(QTableView):
         self.sortByColumn(0, Qt.AscendingOrder)
 
         # ✅ Réappliquer le tri ascendant après chaque reset du modèle
-        model.modelReset.connect(
-            lambda: self.sortByColumn(0, Qt.AscendingOrder)
-        )
+        model.modelReset.connect(self._on_model_reset)
+
+    def _on_model_reset(self) -> None:
+        """Re-apply the initial ascending sort on column 0 after a reset.
+
+        Side Effects:
+            - Sorts the model rows by column 0, ascending (a no-op when
+              another view of the same model already did).
+        """
+        self.sortByColumn(0, Qt.AscendingOrder)
 
     def getSelectedIndexes(self) -> list:
         """Get selected indexes mapped to source model.
@@ -604,24 +1196,42 @@ class OrthogonalityTableView(QTableView):
         filterLineEdit.textChanged.connect(self.filterExpChanged)
 
     def setColumnRegex(self, column: int, pattern: str, case_sensitive: bool = True) -> None:
-        """Set the column used for text-based filtering.
+        """Filter the rows on a regex matched against one column.
 
         Args:
-            column (int): Column index to filter on; ``-1`` to filter all columns.
+            column (int): Column index to filter on.
+            pattern (str): Regex pattern, empty to remove the column's filter.
+            case_sensitive (bool): Match case. Default True.
 
         Side Effects:
-            - Updates the proxy model's filter key column.
+            - Re-filters the proxy model unless the pattern is unchanged.
         """
         self._proxyModel.setColumnRegex(column=column, pattern=pattern, case_sensitive=case_sensitive)
 
     def filterExpChanged(self, text: str) -> None:
-        """Update filter based on search text.
+        """Schedule a filter update from search text.
+
+        The filter is applied 150 ms after the last call, so a burst of
+        keystrokes triggers a single filter pass.
 
         Args:
-            text (str): Filter text (supports regex).
+            text (str): Filter text, matched as plain text unless it
+                contains regex metacharacters.
         """
-        self._proxyModel.setFilterRegularExpression(QRegularExpression(text))
-        self._proxyModel.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self._pending_filter_text = text
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        """Apply the pending search text to the proxy model.
+
+        Side Effects:
+            - Re-filters the proxy unless the text did not change.
+        """
+        text = self._pending_filter_text
+        if text == self._applied_filter_text:
+            return
+        self._applied_filter_text = text
+        self._proxyModel.set_search_text(text)
 
     def getProxyModel(self) -> OrthogonalityTableSortProxy:
         """Get the proxy model.
@@ -31,6 +31,8 @@ class QComboBoxCmap(QComboBox):
     - Icon size: 70x20 pixels
 
     Attributes:
+        _colormaps (list | None): ``(name, QIcon)`` pairs shared by every
+            instance, scanned from disk on first construction.
         Inherits all QComboBox attributes.
 
     Example:
@@ -39,29 +41,50 @@ class QComboBoxCmap(QComboBox):
         >>> selected_cmap = cmap_selector.currentText()
     """
 
+    _colormaps = None
+
+    @classmethod
+    def _load_colormaps(cls) -> list:
+        """Return the available colormaps, scanning the resources only once.
+
+        QIcon is implicitly shared, so every instance reuses the same icons.
+
+        Returns:
+            list[tuple[str, QIcon]]: Colormap names and preview icons, sorted
+            by file name.
+        """
+        if cls._colormaps is None:
+            colormaps = []
+
+            # Get the directory with the colormap images
+            colormap_directory = resource_path("colormaps")
+
+            # Load all PNG colormaps from the resource directory
+            if os.path.isdir(colormap_directory):
+                for filename in sorted(os.listdir(colormap_directory)):
+                    if filename.endswith(".png"):
+                        cmap_path = os.path.join(colormap_directory, filename)
+                        # Use filename without extension as colormap name
+                        cmap_name = os.path.splitext(filename)[0]
+                        colormaps.append((cmap_name, QIcon(cmap_path)))
+
+            cls._colormaps = colormaps
+        return cls._colormaps
+
     def __init__(self):
         """Initialize the colormap combo box.
 
         Side Effects:
-            - Loads all PNG files from 'colormaps' resource directory
+            - Loads all PNG files from 'colormaps' resource directory, on the
+              first construction only
             - Adds each as a combo box item with icon
             - Sets default selection to "Spectral"
             - Adjusts size to fit content
         """
         super().__init__()
 
-        # Get the directory with the colormap images
-        colormap_directory = resource_path("colormaps")
-
-        # Load all PNG colormaps from the resource directory
-        if os.path.isdir(colormap_directory):
-            for filename in sorted(os.listdir(colormap_directory)):
-                if filename.endswith(".png"):
-                    cmap_path = os.path.join(colormap_directory, filename)
-                    cmap_icon = QIcon(cmap_path)
-                    # Use filename without extension as colormap name
-                    cmap_name = os.path.splitext(filename)[0]
-                    self.addItem(cmap_icon, cmap_name)
+        for cmap_name, cmap_icon in self._load_colormaps():
+            self.addItem(cmap_icon, cmap_name)
 
         # Configure appearance
         icon_size = QSize(70, 20)
@@ -17,7 +17,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
@@ -28,19 +27,21 @@ from combo_selector.utils import resource_path
 class Status(QWidget):
     """Status indicator widget with three states: wait, valid, and error.
 
-    Displays a small icon indicating the current status state. Uses a
-    QStackedWidget to switch between three icon states.
+    Displays a small icon indicating the current status state. A single
+    QLabel switches between three cached icon pixmaps.
 
     States:
-    - 0 (Wait): Default state, typically shown before validation
-    - 1 (Valid): Success/OK state, shown when validation passes
-    - 2 (Error): Error/NOK state, shown when validation fails
+    - Wait: Default state, typically shown before validation
+    - Valid: Success/OK state, shown when validation passes
+    - Error: Error/NOK state, shown when validation fails
 
     Class Attributes:
         IconSize (QSize): Size of status icons (16x16 pixels).
+        _pixmap_cache (dict | None): Scaled ``"wait"``/``"ok"``/``"nok"``
+            pixmaps shared by every instance, loaded on first use.
 
     Attributes:
-        qstack (QStackedWidget): Stacked widget containing icon states.
+        label (QLabel): Label showing the current state icon.
 
     Example:
         >>> status = Status()
@@ -50,6 +51,22 @@ class Status(QWidget):
 
     IconSize = QSize(16, 16)
 
+    _pixmap_cache = None
+
+    @classmethod
+    def _pixmaps(cls) -> dict:
+        """Return the scaled state pixmaps, loading them from disk only once.
+
+        Returns:
+            dict[str, QPixmap]: Pixmaps keyed by ``"wait"``, ``"ok"`` and ``"nok"``.
+        """
+        if cls._pixmap_cache is None:
+            cls._pixmap_cache = {
+                name: QPixmap(resource_path(f"icons/{name}.png")).scaled(cls.IconSize)
+                for name in ("wait", "ok", "nok")
+            }
+        return cls._pixmap_cache
+
     def __init__(self, parent: QWidget = None):
         """Initialize the status indicator widget.
 
@@ -57,82 +74,45 @@ class Status(QWidget):
             parent (QWidget, optional): Parent widget.
 
         Side Effects:
-            - Loads wait, ok, and nok icons from resources
-            - Sets default state to "wait" (index 0)
+            - Loads wait, ok, and nok icons from resources on first use
+            - Sets default state to "wait"
         """
         super().__init__(parent)
         self.setFixedSize(35, 40)
 
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        self.qstack = QStackedWidget()
-        self.qstack.setStyleSheet("""background-color:none;""")
-        layout.addWidget(self.qstack)
-
-        # Load and scale icons
-        wait_icon = QPixmap(resource_path("icons/wait.png"))
-        wait_icon = wait_icon.scaled(self.IconSize)
-
-        ok_icon = QPixmap(resource_path("icons/ok.png"))
-        ok_icon = ok_icon.scaled(self.IconSize)
-
-        nok_icon = QPixmap(resource_path("icons/nok.png"))
-        nok_icon = nok_icon.scaled(self.IconSize)
-
-        # Create wait state widget
-        wait_label = QLabel()
-        wait_label.setPixmap(wait_icon)
-        wait_widget = QWidget(self)
-        wait_layout = QHBoxLayout(wait_widget)
-        wait_layout.addWidget(wait_label)
-
-        # Create valid/OK state widget
-        ok_label = QLabel()
-        ok_label.setPixmap(ok_icon)
-        ok_widget = QWidget(self)
-        ok_layout = QHBoxLayout(ok_widget)
-        ok_layout.addWidget(ok_label)
-
-        # Create error/NOK state widget
-        nok_label = QLabel()
-        nok_label.setPixmap(nok_icon)
-        nok_widget = QWidget(self)
-        nok_layout = QHBoxLayout(nok_widget)
-        nok_layout.addWidget(nok_label)
-
-        # Add states to stacked widget
-        self.qstack.addWidget(wait_widget)  # Index 0
-        self.qstack.addWidget(ok_widget)  # Index 1
-        self.qstack.addWidget(nok_widget)  # Index 2
+        layout.setContentsMargins(9, 9, 9, 9)  # icon inset of the former stacked pages
 
-        # Set default state
-        self.qstack.setCurrentIndex(0)
+        self.label = QLabel()
+        self.label.setStyleSheet("""background-color:none;""")
+        layout.addWidget(self.label)
 
+        # Set default state
+        self.set_wait()
 
     def set_error(self) -> None:
         """Set status to error/NOK state (red X).
 
         Side Effects:
-            - Switches to error icon (index 2)
+            - Switches to the error icon
         """
-        self.qstack.setCurrentIndex(2)
+        self.label.setPixmap(self._pixmaps()["nok"])
 
     def set_valid(self) -> None:
         """Set status to valid/OK state (green checkmark).
 
         Side Effects:
-            - Switches to valid icon (index 1)
+            - Switches to the valid icon
         """
-        self.qstack.setCurrentIndex(1)
+        self.label.setPixmap(self._pixmaps()["ok"])
 
     def set_wait(self) -> None:
         """Set status to wait/pending state (hourglass).
 
         Side Effects:
-            - Switches to wait icon (index 0)
+            - Switches to the wait icon
         """
-        self.qstack.setCurrentIndex(0)
+        self.label.setPixmap(self._pixmaps()["wait"])
 
 
 # =============================================================================
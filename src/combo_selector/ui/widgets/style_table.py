@@ -5,10 +5,13 @@ This module provides:
 - StyledTable – card shell (title bar + TablePanel + footer)
 """
 
+import hashlib
 import sys
+import threading
 
+import numpy as np
 import pandas as pd
-from PySide6.QtCore import QModelIndex, Qt, QThreadPool, Signal, QSize
+from PySide6.QtCore import QEvent, QModelIndex, Qt, QThreadPool, QTimer, Signal, QSize
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -31,6 +34,103 @@ from combo_selector.ui.widgets.orthogonality_table import (
 )
 
 
+# Card stylesheet shared by every StyledTable instance
+_STYLESHEET = """
+    QWidget {
+        font-family: Segoe UI, Arial;
+        font-size: 13px;
+    }
+
+    QLabel#TitleBar {
+        background-color: #183881;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 19px;
+    }
+
+    QFrame#TitleBarFrame  {
+        background-color: #183881;
+        border-top-left-radius: 10px;
+        border-top-right-radius: 10px;
+    }
+
+    /* 1. Le style global des sections de l'en-tête (Inchangé) */
+    QHeaderView::section {
+        background-color: #d1d9fc;
+        color: #1859b4;
+        font-size: 12px;
+        padding: 4px;
+        font-weight: bold;
+        border: 1px solid #d0d4da;
+    }
+
+    /* 2. AJOUT : Emplacement de la flèche de tri */
+    QHeaderView::up-arrow, QHeaderView::down-arrow {
+        padding-right: 4px;
+        width: 10px;
+        height: 10px;
+    }
+
+    /* 3. AJOUT : Dessin de la flèche montante (Tri croissant) */
+    QHeaderView::up-arrow {
+        image: url(data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="%231859b4"><path d="M7 14l5-5 5 5z"/></svg>);
+    }
+
+    /* 4. AJOUT : Dessin de la flèche descendante (Tri décroissant) */
+    QHeaderView::down-arrow {
+        image: url(data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="%231859b4"><path d="M7 10l5 5 5-5z"/></svg>);
+    }
+
+    QTableView {
+        background-color: #F6F8FD;
+        gridline-color: #D4D6EC;
+        selection-background-color: #c9daf8;
+        selection-color: #000000;
+        font-size: 11px;
+    }
+
+    QTableView::item:selected {
+        background-color: #d8e5fc;
+        color: #000000;
+    }
+
+    QTableView::item {
+        background: transparent;
+        border: none;
+        border-radius: 0px;
+    }
+
+    QScrollBar:vertical {
+        border: none;
+        background: #bdcaf6;
+        width: 10px;
+        margin: 4px 0 4px 0;
+    }
+
+    QScrollBar::handle:vertical {
+        background: white;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+
+    QScrollBar::add-line:vertical,
+    QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+
+    QScrollBar::add-page:vertical,
+    QScrollBar::sub-page:vertical {
+        background: none;
+    }
+
+    QFrame#Footer {
+        background-color: #f1f3f6;
+        border-bottom-left-radius: 12px;
+        border-bottom-right-radius: 12px;
+    }
+"""
+
+
 # =============================================================================
 # TablePanel – pure table logic (model + view + async loading)
 # =============================================================================
@@ -43,10 +143,11 @@ class TablePanel(QWidget):
     those belong to :class:`StyledTable`.
 
     Signals:
-        selectionChanged(): Emitted when the table selection changes.
+        selectionChanged(): Emitted once a burst of selection changes has
+            settled for 50 ms.
 
     Attributes:
-        threadpool (QThreadPool): Thread pool for async data loading.
+        threadpool (QThreadPool): Shared global thread pool for async data loading.
         model (OrthogonalityTableModel): Table data model.
         table (OrthogonalityTableView): Table view widget.
         header (HeaderButton): Custom header with filter-button support.
@@ -66,9 +167,12 @@ class TablePanel(QWidget):
     ) -> None:
         super().__init__(parent)
 
-        self.threadpool = QThreadPool()
+        # Every table formats on Qt's process-wide pool instead of owning one
+        self.threadpool = QThreadPool.globalInstance()
 
         self.value_format = value_format
+        self._data_fingerprint = None
+        self._load_cancel = None
 
         # Model + view
         self.model = OrthogonalityTableModel(color_config = color_config,
@@ -81,6 +185,8 @@ class TablePanel(QWidget):
         # Custom header with filter-button support
         self.header = HeaderButton(Qt.Horizontal, self.table)
         self.table.setHorizontalHeader(self.header)
+        # Column sizing measures the first 50 rows, not the default 1000
+        self.header.setResizeContentsPrecision(50)
         self.header_widgets: list[QWidget] = []
 
         # Delegate for NaN highlighting
@@ -93,7 +199,12 @@ class TablePanel(QWidget):
         layout.addWidget(self.table)
 
 
-        # Selection forwarding
+        # Selection forwarding: bursts (shift-click ranges, model resets) are
+        # coalesced into one selectionChanged once they settle
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self.selectionChanged)
         self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
     # ------------------------------------------------------------------
@@ -101,7 +212,8 @@ class TablePanel(QWidget):
     # ------------------------------------------------------------------
 
     def _on_selection_changed(self) -> None:
-        self.selectionChanged.emit()
+        """(Re)start the 50 ms timer that emits :attr:`selectionChanged`."""
+        self._selection_timer.start()
 
     def get_selected_rows(self) -> list:
         """Return a list of selected :class:`QModelIndex` objects."""
@@ -116,29 +228,83 @@ class TablePanel(QWidget):
     # ------------------------------------------------------------------
 
     def async_set_table_data(self, df: pd.DataFrame) -> None:
-        """Load *df* in a background thread; updates the view when done."""
-        worker = TableDataWorker(df, self.model.get_header_label(), value_format=self.value_format)
+        """Load *df* in a background thread; updates the view when done.
+
+        Nothing is reloaded when *df* matches the previously loaded frame
+        (same values, columns, dtypes and header labels).
+        """
+        fingerprint = self._fingerprint(df)
+        if fingerprint is not None and fingerprint == self._data_fingerprint:
+            return
+        self._data_fingerprint = fingerprint
+
+        # Only the newest load may reach the model: abandon the one in flight
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        self._load_cancel = threading.Event()
+
+        worker = TableDataWorker(
+            df,
+            self.model.get_header_label(),
+            value_format=self.value_format,
+            cancel_event=self._load_cancel,
+        )
         worker.signals.finished.connect(self._handle_data)
         self.threadpool.start(worker)
 
+    def _fingerprint(self, df: pd.DataFrame) -> bytes | None:
+        """Digest of everything the formatted table depends on, or None if
+        *df* holds unhashable cells."""
+        try:
+            digest = hashlib.blake2b(
+                pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(),
+                digest_size=16,
+            )
+        except (TypeError, ValueError):
+            return None
+        digest.update(repr((
+            list(df.columns),
+            [str(t) for t in df.dtypes],
+            self.model.get_header_label(),
+            self.value_format,
+        )).encode())
+        return digest.digest()
+
     def set_tooltip_config(self,tooltip_config):
         self.model.set_tooltip_config(tooltip_config)
 
     def _handle_data(self, data: list, rows: int, cols: int) -> None:
-        """Slot: receive formatted data from the async worker."""
-        self.model.apply_formatted_data(data, rows, cols)
+        """Slot: receive the formatted columns from the async worker."""
+        self.model.apply_formatted_columns(data, rows, cols)
 
         header = self.table.horizontalHeader()
-        header.setResizeContentsPrecision(50)
+        self._polish_ancestors()
         self.table.resizeColumnsToContents()
 
-        for i in range(cols):
-            header.setSectionResizeMode(i, QHeaderView.Interactive)
-            if i == cols - 1:
-                self.table.setColumnWidth(i, 250)
+        # One call sets every section, instead of a header relayout per column
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        if cols:
+            self.table.setColumnWidth(cols - 1, 250)
+
+    def _polish_ancestors(self) -> None:
+        """Polish the enclosing widgets, outermost first, before measuring.
+
+        A card that is not shown yet applies its stylesheet when polished;
+        the columns have to be measured with those fonts.
+        """
+        ancestors = []
+        parent = self.parentWidget()
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parent.parentWidget()
+        for widget in reversed(ancestors):
+            widget.ensurePolished()
 
     def clean_table(self) -> None:
-        """Clear all data and reset to the default row count."""
+        """Clear all data, cancel any pending load and reset to the default row count."""
+        self._data_fingerprint = None
+        if self._load_cancel is not None:
+            self._load_cancel.set()
         self.model.set_formated_data([])
         self.set_default_row_count(10)
 
@@ -193,21 +359,49 @@ class TablePanel(QWidget):
         """Return the current number of rows."""
         return self.model.rowCount(QModelIndex())
 
+    def find_row(self, text: str, column: int = 0) -> int:
+        """Return the first view row whose *column* displays *text*, or -1.
+
+        The column is matched in one vectorised comparison instead of a
+        ``data()`` call per row; rows hidden by a filter are not returned.
+        """
+        matches = np.flatnonzero(self.model.display_column(column) == text)
+        proxy = self.table.getProxyModel()
+        view_rows = [
+            proxy.mapFromSource(self.model.index(int(row), column)).row()
+            for row in matches
+        ]
+        return min((row for row in view_rows if row >= 0), default=-1)
+
     def resize_column_width(self) -> None:
         """Stretch column 1 to fill available width."""
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
 
     def set_section_resize_mode(self) -> None:
         """Auto-size all columns; stretch column 1 (Combination)."""
-        for col in range(self.model.columnCount(QModelIndex())):
-            self.table.setColumnWidth(col, self.table.columnWidth(col) + 10)
+        header = self.table.horizontalHeader()
+        header.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+
+        self._polish_ancestors()
 
-        self.table.horizontalHeader().setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.table.horizontalHeader().setStretchLastSection(True)
+        # Measure the contents once, pad the widths, then keep them
+        # Interactive: ResizeToContents re-measured on every header layout
+        # and overrode the padding. Stretched sections (column 1, and the
+        # last one, which HeaderButton stretches) are not padded, the
+        # header assigns their width anyway
+        self.table.resizeColumnsToContents()
+        col_count = header.count()
+        stretched = {1, col_count - 1} if col_count > 1 else set()
 
-        for i in range(self.table.model().columnCount(QModelIndex())):
-            mode = QHeaderView.Stretch if i == 1 else QHeaderView.ResizeToContents
-            self.table.horizontalHeader().setSectionResizeMode(i, mode)
+        # Read every measured width before writing any: sectionSize() runs
+        # the header's pending resize, which a write in between re-queues
+        widths = [header.sectionSize(col) + 10 for col in range(col_count)]
+        for col, width in enumerate(widths):
+            if col not in stretched:
+                header.resizeSection(col, width)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        if col_count > 1:
+            header.setSectionResizeMode(1, QHeaderView.Stretch)
 
 
     # ------------------------------------------------------------------
@@ -349,7 +543,9 @@ class StyledTable(QWidget):
         card.layout().addWidget(self.footer)
         outer.addWidget(card, 1)
 
-        self._apply_styles()
+        # The stylesheet is applied when the card is first polished (before
+        # its first show or column sizing), so cards never shown skip it
+        self._styled = False
 
     def add_title_bar_info_button(self, markdown_path:str) -> None:
         title_help_btn = SectionHelpButton(
@@ -435,6 +631,9 @@ class StyledTable(QWidget):
     def get_row_count(self) -> int:
         return self.table_panel.get_row_count()
 
+    def find_row(self, text: str, column: int = 0) -> int:
+        return self.table_panel.find_row(text, column)
+
     def select_row(self, index: int) -> None:
         self.table_panel.select_row(index)
 
@@ -472,101 +671,15 @@ class StyledTable(QWidget):
     # Styles
     # ------------------------------------------------------------------
 
-    def _apply_styles(self) -> None:
-        self.setStyleSheet("""
-            QWidget {
-                font-family: Segoe UI, Arial;
-                font-size: 13px;
-            }
-
-            QLabel#TitleBar {
-                background-color: #183881;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 19px;
-            }
-
-            QFrame#TitleBarFrame  {
-                background-color: #183881;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }
-
-            /* 1. Le style global des sections de l'en-tête (Inchangé) */
-            QHeaderView::section {
-                background-color: #d1d9fc;
-                color: #1859b4;
-                font-size: 12px;
-                padding: 4px;
-                font-weight: bold;
-                border: 1px solid #d0d4da;
-            }
-
-            /* 2. AJOUT : Emplacement de la flèche de tri */
-            QHeaderView::up-arrow, QHeaderView::down-arrow {
-                padding-right: 4px;
-                width: 10px;
-                height: 10px;
-            }
-
-            /* 3. AJOUT : Dessin de la flèche montante (Tri croissant) */
-            QHeaderView::up-arrow {
-                image: url(data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="%231859b4"><path d="M7 14l5-5 5 5z"/></svg>);
-            }
-
-            /* 4. AJOUT : Dessin de la flèche descendante (Tri décroissant) */
-            QHeaderView::down-arrow {
-                image: url(data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="%231859b4"><path d="M7 10l5 5 5-5z"/></svg>);
-            }
-
-            QTableView {
-                background-color: #F6F8FD;
-                gridline-color: #D4D6EC;
-                selection-background-color: #c9daf8;
-                selection-color: #000000;
-                font-size: 11px;
-            }
-
-            QTableView::item:selected {
-                background-color: #d8e5fc;
-                color: #000000;
-            }
-
-            QTableView::item {
-                background: transparent;
-                border: none;
-                border-radius: 0px;
-            }
-
-            QScrollBar:vertical {
-                border: none;
-                background: #bdcaf6;
-                width: 10px;
-                margin: 4px 0 4px 0;
-            }
+    def event(self, event: QEvent) -> bool:
+        """Apply the stylesheet on the first polish, ahead of the children."""
+        if event.type() == QEvent.Polish and not self._styled:
+            self._styled = True
+            self._apply_styles()
+        return super().event(event)
 
-            QScrollBar::handle:vertical {
-                background: white;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {
-                background: none;
-            }
-
-            QFrame#Footer {
-                background-color: #f1f3f6;
-                border-bottom-left-radius: 12px;
-                border-bottom-right-radius: 12px;
-            }
-        """)
+    def _apply_styles(self) -> None:
+        self.setStyleSheet(_STYLESHEET)
 
 
 # =============================================================================
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Return the QApplication, created once for the whole session."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
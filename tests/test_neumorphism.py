@@ -0,0 +1,139 @@
+"""Tests for the neumorphism box shadow effect."""
+
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPainter, QPixmap
+
+from combo_selector.ui.widgets import neumorphism
+from combo_selector.ui.widgets.neumorphism import (
+    _GL_MAX_FETCHES,
+    BoxShadow,
+    _box_blur_axis,
+    _box_blur_sigma,
+    _gl_kernel,
+    radius_to_boxes,
+)
+
+# Opaque 20x20 square at (20, 10) on a transparent 60x40 source
+SQUARE_RIGHT = 40
+ROW = 20
+
+
+@pytest.fixture
+def source(qapp):
+    pixmap = QPixmap(60, 40)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.fillRect(20, 10, 20, 20, QColor("#808080"))
+    painter.end()
+    return pixmap
+
+
+def outside_alphas(source, blur, offset_x=5):
+    """Alpha of the outside shadow along a row, right of the square."""
+    shadow = BoxShadow(
+        [{"outside": True, "offset": [offset_x, 0], "blur": blur, "color": "#000000"}]
+    )
+    image = shadow._smooth_outside_shadow(source)
+    return [image.pixelColor(x, ROW).alpha() for x in range(SQUARE_RIGHT, 60)]
+
+
+def test_radius_to_boxes_has_no_pass_for_zero_blur():
+    assert radius_to_boxes(0) == ()
+    assert radius_to_boxes(-2) == ()
+    assert radius_to_boxes(3) == (1, 1, 1)
+    assert radius_to_boxes(12) == (2, 2, 2)  # halved for the downscaled copy
+
+
+def test_zero_blur_shadow_keeps_a_hard_edge(source):
+    alphas = outside_alphas(source, blur=0)
+    assert alphas[:5] == [255] * 5
+    assert set(alphas[5:]) == {0}
+
+
+@pytest.mark.parametrize("blur", [3, 12])
+def test_blurred_shadow_fades_out(source, blur):
+    alphas = outside_alphas(source, blur)
+    assert alphas == sorted(alphas, reverse=True)
+    assert 0 < alphas[5] < 255
+    # A larger radius spreads the shadow further from the square
+    assert alphas[5 + blur] < alphas[5]
+
+
+def test_larger_blur_spreads_further(source):
+    small, large = outside_alphas(source, 3), outside_alphas(source, 12)
+    assert sum(a > 0 for a in large) > sum(a > 0 for a in small)
+
+
+def gl_pass(signal, center_weight, fetches):
+    """Emulate one GPU pass on a 1D signal, with linear texture filtering."""
+    positions = np.arange(signal.size, dtype=float)
+
+    def fetch(offset):
+        return np.interp(positions + offset, positions, signal, left=0.0, right=0.0)
+
+    out = signal * center_weight
+    for offset, weight in fetches:
+        out = out + (fetch(offset) + fetch(-offset)) * weight
+    return out
+
+
+def variance(kernel):
+    x = np.arange(kernel.size) - kernel.size // 2
+    return float((kernel * x**2).sum() / kernel.sum())
+
+
+@pytest.mark.parametrize("r", [1, 3, 5, 12, 40, 200])
+def test_gl_kernel_samples_every_texel_like_the_cpu_blur(r):
+    repeats, center_weight, fetches = _gl_kernel(r)
+    assert len(fetches) <= _GL_MAX_FETCHES
+
+    # Merged fetches sit between two adjacent texels
+    offsets = [offset for offset, _ in fetches]
+    for i, offset in enumerate(offsets):
+        assert 2 * i + 1 <= offset <= 2 * i + 2
+
+    impulse = np.zeros(1201)
+    impulse[600] = 1.0
+    kernel = impulse
+    for _ in range(repeats):
+        kernel = gl_pass(kernel, center_weight, fetches)
+
+    assert kernel.sum() == pytest.approx(1.0)
+    # Cut at 3 sigma, the kernel loses a little of the Gaussian's variance
+    assert variance(kernel) == pytest.approx(_box_blur_sigma(r) ** 2, rel=0.05)
+
+
+@pytest.mark.parametrize("r", [1, 3, 5])
+def test_box_blur_sigma_matches_the_box_passes(r):
+    impulse = np.zeros((1, 101, 4), dtype=np.int64)
+    impulse[0, 50] = 1 << 20
+    blurred = impulse
+    for box in radius_to_boxes(r):
+        blurred = _box_blur_axis(blurred, box, axis=1)
+    assert variance(blurred[0, :, 0].astype(float)) == pytest.approx(
+        _box_blur_sigma(r) ** 2, rel=0.01
+    )
+
+
+def test_opengl_effects_share_one_gpu_blur(qapp, monkeypatch):
+    created = []
+
+    class FakeGLBlur:
+        def __init__(self):
+            created.append(self)
+
+        def release(self):
+            pass
+
+    monkeypatch.setattr(neumorphism, "_GLBlur", FakeGLBlur)
+    monkeypatch.setattr(neumorphism, "_gl_blur", None)
+    monkeypatch.setattr(neumorphism, "_gl_blur_failed", False)
+
+    BoxShadow(backend="opengl")
+    BoxShadow(backend="opengl")
+    assert len(created) == 1
+
+    neumorphism._release_gl_blur()
+    assert neumorphism._gl_blur is None
@@ -0,0 +1,289 @@
+"""Tests for the orthogonality table model and its sort/filter proxy."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from PySide6.QtCore import QPersistentModelIndex, Qt
+
+from combo_selector.ui.widgets.orthogonality_table import (
+    _FORMAT_BLOCK_ROWS,
+    OrthogonalityTableModel,
+    OrthogonalityTableSortProxy,
+)
+
+HEADER = ["Set #", "2D Combination", "Pearson", "Practical 2D peak capacity"]
+
+# Column-major, as produced by TableDataWorker
+COLUMNS = [
+    ["1", "2", "3", "4"],
+    ["HILIC vs RPLC", "SEC vs RPLC", "IEX vs HILIC", "RPLC vs RPLC"],
+    ["0.500", "NA", "0.125", "0.900"],
+    ["120", "85", "300", "42"],
+]
+
+
+@pytest.fixture
+def model(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(HEADER)
+    model.apply_formatted_columns(COLUMNS, 4, 4)
+    return model
+
+
+@pytest.fixture
+def proxy(model):
+    proxy = OrthogonalityTableSortProxy()
+    proxy.setSourceModel(model)
+    model.set_proxy(proxy)
+    return proxy
+
+
+def column_text(model, column):
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def proxy_column_text(proxy, column):
+    return [proxy.data(proxy.index(row, column)) for row in range(proxy.rowCount())]
+
+
+def test_set_data_formats_numeric_columns(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(["Set #", "Pearson", "Practical 2D peak capacity", "Label"])
+    model.set_data(
+        pd.DataFrame(
+            {
+                "Set #": [1, 2],
+                "Pearson": [0.12345, math.nan],
+                "Practical 2D peak capacity": [119.6, math.nan],
+                "Label": ["HILIC", None],
+            }
+        )
+    )
+
+    assert column_text(model, 0) == ["1", "2"]
+    assert column_text(model, 1) == ["0.123", "NA"]
+    assert column_text(model, 2) == ["120", "nan"]
+    assert column_text(model, 3) == ["HILIC", "NA"]
+    assert model.data(model.index(1, 1), Qt.BackgroundRole) is not None
+    assert model.data(model.index(0, 1), Qt.BackgroundRole) is None
+
+
+def test_set_data_formats_numeric_rows_block_by_block(qapp):
+    row_count = 2 * _FORMAT_BLOCK_ROWS + 5
+    values = np.arange(row_count) / 8
+    model = OrthogonalityTableModel()
+    model.set_header_label(["Set #", "Pearson"])
+    model.set_data(pd.DataFrame({"Set #": np.arange(row_count), "Pearson": values}))
+    assert model._pending_blocks.tolist() == [True, True, True]
+
+    # Last row of the second block, then first row of the third one
+    last = 2 * _FORMAT_BLOCK_ROWS - 1
+    assert model.data(model.index(last, 1)) == f"{values[last]:.3f}"
+    assert model._pending_blocks.tolist() == [True, False, True]
+    assert model.data(model.index(last + 1, 0)) == str(last + 1)
+    assert model._pending_blocks.tolist() == [True, False, False]
+
+    # Whole-column readers finish the remaining blocks
+    assert model.display_column(1).tolist() == [f"{v:.3f}" for v in values]
+    assert model._pending_blocks is None
+
+
+def test_set_search_text_matches_substring_case_insensitively(proxy):
+    proxy.set_search_text("rplc vs")
+    assert proxy_column_text(proxy, 1) == ["RPLC vs RPLC"]
+
+    proxy.set_search_text("hilic")
+    assert proxy_column_text(proxy, 1) == ["HILIC vs RPLC", "IEX vs HILIC"]
+
+    proxy.set_search_text("")
+    assert proxy.rowCount() == 4
+
+
+def test_set_search_text_does_not_match_across_cells(proxy):
+    # "4" ends the Set # cell and "RPLC" starts the next one
+    proxy.set_search_text("4rplc")
+    assert proxy.rowCount() == 0
+
+
+def test_set_search_text_accepts_regex_and_falls_back_to_plain_text(proxy):
+    proxy.set_search_text("^sec")
+    assert proxy_column_text(proxy, 1) == ["SEC vs RPLC"]
+
+    # Incomplete regex: matched literally, nothing contains "(sec"
+    proxy.set_search_text("(sec")
+    assert proxy.rowCount() == 0
+
+
+def test_numeric_sort_keys_stay_float64(model):
+    assert model._sort_keys[2].dtype == np.float64
+    assert model._sort_keys[3].dtype == np.float64
+    assert model._sort_keys[1].dtype == object
+
+
+def test_sort_numeric_column_ascending_puts_na_last(model):
+    model.sort(2, Qt.AscendingOrder)
+    assert column_text(model, 2) == ["0.125", "0.500", "0.900", "NA"]
+
+
+def test_sort_numeric_column_descending_treats_na_as_infinity(model):
+    model.sort(2, Qt.DescendingOrder)
+    assert column_text(model, 2) == ["NA", "0.900", "0.500", "0.125"]
+
+
+def test_sort_compares_numbers_not_text(model):
+    model.sort(3, Qt.AscendingOrder)
+    assert column_text(model, 3) == ["42", "85", "120", "300"]
+
+
+def test_sort_text_column_and_restore_data_order(model):
+    model.sort(1, Qt.AscendingOrder)
+    assert column_text(model, 1) == sorted(COLUMNS[1])
+
+    model.sort(-1)
+    assert column_text(model, 1) == COLUMNS[1]
+
+
+def test_sort_mixed_column_puts_numbers_before_text(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(["Value"])
+    model.apply_formatted_columns([["b", "10", "NA", "2", "a"]], 5, 1)
+
+    model.sort(0, Qt.AscendingOrder)
+    assert column_text(model, 0) == ["2", "10", "NA", "a", "b"]
+
+
+def test_sort_keeps_ties_in_data_order(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(["Set #", "Score"])
+    model.apply_formatted_columns([["1", "2", "3", "4"], ["1", "0", "1", "0"]], 4, 2)
+
+    model.sort(1, Qt.AscendingOrder)
+    assert column_text(model, 0) == ["2", "4", "1", "3"]
+    model.sort(1, Qt.DescendingOrder)
+    assert column_text(model, 0) == ["1", "3", "2", "4"]
+
+
+def test_sort_moves_persistent_indexes_with_their_rows(model):
+    tracked = QPersistentModelIndex(model.index(1, 1))  # "SEC vs RPLC"
+    model.sort(1, Qt.AscendingOrder)
+
+    assert tracked.row() == 3
+    assert tracked.column() == 1
+    assert model.data(model.index(tracked.row(), 1)) == "SEC vs RPLC"
+
+
+def test_set_data_sorts_raw_values(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(["Pearson", "Mixed"])
+    model.set_data(
+        pd.DataFrame(
+            {"Pearson": [0.5, math.nan, 0.25], "Mixed": pd.Series([10, 9, 100], dtype=object)}
+        )
+    )
+
+    model.sort(0, Qt.AscendingOrder)
+    assert column_text(model, 0) == ["0.250", "0.500", "NA"]
+    model.sort(1, Qt.AscendingOrder)
+    assert column_text(model, 1) == ["9", "10", "100"]
+
+
+def test_proxy_sort_reorders_the_source_model(model, proxy):
+    proxy.sort(3, Qt.AscendingOrder)
+    assert column_text(model, 3) == ["42", "85", "120", "300"]
+    assert proxy.mapToSourceRow(0) == 0
+
+
+def test_search_follows_the_sorted_row_order(model, proxy):
+    model.sort(3, Qt.AscendingOrder)
+    proxy.set_search_text("rplc")
+    assert proxy_column_text(proxy, 3) == ["42", "85", "120"]
+
+
+def test_display_column_follows_the_sorted_row_order(model):
+    assert model.display_column(1).tolist() == COLUMNS[1]
+    model.sort(0, Qt.DescendingOrder)
+    assert model.display_column(0).tolist() == ["4", "3", "2", "1"]
+    assert model.display_column(9).size == 0
+
+
+def test_find_row_maps_through_sort_and_filter(qapp):
+    pytest.importorskip("markdown")
+    from combo_selector.ui.widgets.style_table import TablePanel
+
+    panel = TablePanel()
+    panel.model.set_header_label(HEADER)
+    panel.model.apply_formatted_columns(COLUMNS, 4, 4)
+
+    assert panel.find_row("IEX vs HILIC", column=1) == 2
+    assert panel.find_row("missing", column=1) == -1
+
+    panel.model.sort(3, Qt.DescendingOrder)
+    assert panel.find_row("IEX vs HILIC", column=1) == 0
+
+    # Filtered out rows are not found; the others map to their view row
+    panel.table.getProxyModel().set_search_text("rplc")
+    assert panel.find_row("IEX vs HILIC", column=1) == -1
+    assert panel.find_row("SEC vs RPLC", column=1) == 1
+
+
+def test_column_regex_filters_one_column(proxy):
+    proxy.setColumnRegex(1, "^rplc", case_sensitive=False)
+    assert proxy_column_text(proxy, 0) == ["4"]
+
+    proxy.setColumnRegex(1, "^rplc")
+    assert proxy.rowCount() == 0
+
+    proxy.setColumnRegex(1, "")
+    assert proxy.rowCount() == 4
+
+
+def test_column_regex_combines_with_search_text(proxy):
+    proxy.set_search_text("rplc")
+    proxy.setColumnRegex(3, r"^\d{2}$")
+    assert proxy_column_text(proxy, 0) == ["2", "4"]
+
+
+def test_same_column_regex_does_not_refilter(proxy, monkeypatch):
+    proxy.setColumnRegex(1, "HILIC")
+    calls = []
+    monkeypatch.setattr(proxy, "invalidateFilter", lambda: calls.append(True))
+
+    proxy.setColumnRegex(1, "HILIC")
+    assert calls == []
+    proxy.setColumnRegex(1, "HILIC", case_sensitive=False)
+    assert calls == [True]
+
+
+def test_apply_formatted_columns_serves_cells_in_row_order(model):
+    assert (model.rowCount(), model.columnCount()) == (4, 4)
+    assert column_text(model, 1) == COLUMNS[1]
+    assert model.data(model.index(2, 3)) == "300"
+    assert model.headerData(2, Qt.Horizontal) == "Pearson"
+
+
+def test_apply_formatted_columns_highlights_na_cells(model):
+    assert model.data(model.index(1, 2), Qt.BackgroundRole) is not None
+    assert model.data(model.index(0, 2), Qt.BackgroundRole) is None
+    assert model.data(model.index(1, 1), Qt.BackgroundRole) is None
+
+
+def test_apply_formatted_columns_matches_row_major_data(qapp, model):
+    rows = [list(row) for row in zip(*COLUMNS)]
+    row_model = OrthogonalityTableModel()
+    row_model.set_header_label(HEADER)
+    row_model.apply_formatted_data(rows, 4, 4)
+
+    assert (row_model._formatted_data == model._formatted_data).all()
+    assert (row_model._is_nan == model._is_nan).all()
+    for row_keys, column_keys in zip(row_model._sort_keys, model._sort_keys):
+        assert row_keys.tolist() == column_keys.tolist()
+
+
+def test_placeholder_rows_have_no_data(qapp):
+    model = OrthogonalityTableModel()
+    model.set_header_label(HEADER)
+    model.set_default_row_count(3)
+    assert model.rowCount() == 3
+    assert model.data(model.index(2, 1)) is None
@@ -0,0 +1,43 @@
+"""Tests for the table panel widget."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("markdown")
+
+from combo_selector.ui.widgets.style_table import TablePanel  # noqa: E402
+
+HEADER = ["Set #", "Pearson"]
+
+
+class RecordingPool:
+    """Stand-in thread pool that keeps workers instead of running them."""
+
+    def __init__(self):
+        self.workers = []
+
+    def start(self, worker):
+        self.workers.append(worker)
+
+
+@pytest.fixture
+def panel(qapp):
+    panel = TablePanel()
+    panel.model.set_header_label(HEADER)
+    panel.threadpool = RecordingPool()
+    return panel
+
+
+def test_new_load_cancels_the_one_in_flight(panel):
+    panel.async_set_table_data(pd.DataFrame({"Set #": [1], "Pearson": [0.1]}))
+    panel.async_set_table_data(pd.DataFrame({"Set #": [2], "Pearson": [0.2]}))
+    stale, current = panel.threadpool.workers
+
+    assert stale.is_cancelled()
+    assert not current.is_cancelled()
+
+    # The stale run finishes last but never reaches the model
+    current.run()
+    stale.run()
+    assert panel.model.display_column(1).tolist() == ["0.200"]
+
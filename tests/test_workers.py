@@ -0,0 +1,97 @@
+"""Tests for the table formatting worker."""
+
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from combo_selector.core.workers import TableDataWorker, _printf_format
+
+HEADER = ["Set #", "2D Combination", "Pearson", "Practical 2D peak capacity"]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "Set #": [1, 2, 3],
+            "2D Combination": ["HILIC vs RPLC", "SEC vs RPLC", "IEX vs HILIC"],
+            "Pearson": [0.12345, math.nan, -1.0],
+            "Practical 2D peak capacity": [119.5, 84.2, math.nan],
+        }
+    )
+
+
+def run_worker(worker):
+    results = []
+    worker.signals.finished.connect(lambda *args: results.append(args))
+    worker.run()
+    return results
+
+
+def test_formats_each_column_by_type(qapp, frame):
+    results = run_worker(TableDataWorker(frame, HEADER, ".3f"))
+
+    assert len(results) == 1
+    columns, row_count, col_count = results[0]
+    assert (row_count, col_count) == (3, 4)
+    assert columns == [
+        ["1", "2", "3"],
+        ["HILIC vs RPLC", "SEC vs RPLC", "IEX vs HILIC"],
+        ["0.123", "NA", "-1.000"],
+        ["120", "84", "nan"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "value_format",
+    [".3f", ".2e", "g", "+.2f", " .1f", "010.3f", "#.0f", "-10.3f", "10.3f", ".1%", ",.2f"],
+)
+def test_formats_floats_like_format(qapp, value_format):
+    values = [0.12345, -1.0, 12345.678, math.inf, math.nan]
+    frame = pd.DataFrame({"Pearson": values})
+
+    results = run_worker(TableDataWorker(frame, ["Pearson"], value_format))
+
+    expected = ["NA" if math.isnan(v) else format(v, value_format) for v in values]
+    assert results[0][0] == [expected]
+
+
+@pytest.mark.parametrize(
+    "value_format, printf_format",
+    [(".3f", "%.3f"), ("+010.2e", "%+010.2e"), ("-10.3f", None), (",.2f", None), (".1%", None)],
+)
+def test_printf_format_only_for_equivalent_specs(value_format, printf_format):
+    assert _printf_format(value_format) == printf_format
+
+
+def test_object_columns_fall_back_to_per_cell_formatting(qapp):
+    frame = pd.DataFrame({"Mixed": [1, 0.5, math.nan, "text"]}, dtype=object)
+    results = run_worker(TableDataWorker(frame, ["Mixed"], ".3f"))
+    assert results[0][0] == [["1", "0.500", "NA", "text"]]
+
+
+def test_integer_columns_are_not_float_formatted(qapp):
+    frame = pd.DataFrame({"Set #": np.arange(3, dtype=np.int64)})
+    results = run_worker(TableDataWorker(frame, ["Set #"], ".3f"))
+    assert results[0][0] == [["0", "1", "2"]]
+
+
+def test_cancelled_worker_emits_nothing(qapp, frame):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert run_worker(TableDataWorker(frame, HEADER, ".3f", cancel_event)) == []
+
+
+def test_unset_cancel_event_does_not_cancel(qapp, frame):
+    worker = TableDataWorker(frame, HEADER, ".3f", threading.Event())
+    assert not worker.is_cancelled()
+    assert len(run_worker(worker)) == 1
+
+
+
+def test_empty_frame_reports_no_columns(qapp, frame):
+    results = run_worker(TableDataWorker(frame.iloc[:0], HEADER, ".3f"))
+    assert results == [([[], [], [], []], 0, 0)]